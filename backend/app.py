@@ -1,13 +1,28 @@
 import os
+import base64
+import heapq
+import itertools
 from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
+from flask.json.provider import JSONProvider
 from datetime import datetime, timezone
-from werkzeug.utils import secure_filename
 import boto3
+from boto3.s3.transfer import TransferConfig
+from boto3.exceptions import S3UploadFailedError
+from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import json
-import uuid
+import orjson
+import msgspec
+import time
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from typing import Annotated, Literal, get_args
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,7 +31,19 @@ load_dotenv()
 from auth import token_required
 
 # --- Configuration ---
-ALLOWED_EXTENSIONS = {'glb'}
+ALLOWED_EXTENSIONS = frozenset(('glb',))
+# Deliberately loose: one '@', no whitespace, and a dot in the domain part
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# --- Issue validation constants ---
+IssuePriority = Literal['low', 'medium', 'high']
+IssueStatus = Literal['open', 'in-progress', 'resolved']
+ISSUE_PRIORITIES = frozenset(get_args(IssuePriority))
+ISSUE_STATUSES = frozenset(get_args(IssueStatus))
+ISSUE_UPDATE_FIELDS = ('title', 'description', 'status', 'priority')
+# A string with at least one non-whitespace character
+NonBlank = Annotated[str, msgspec.Meta(pattern=r'\S')]
+MAX_BATCH_ISSUES = 100
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 S3_BUCKET_NAME = os.environ.get('S3_BUCKET_NAME')
 COGNITO_USER_POOL_ID = os.environ.get('COGNITO_USER_POOL_ID')
@@ -26,17 +53,126 @@ DYNAMODB_ISSUES_TABLE = os.environ.get('DYNAMODB_TABLE_NAME', 'bim-viewer-issues
 DYNAMODB_PROJECTS_TABLE = 'bim-viewer-projects'
 DYNAMODB_PERMISSIONS_TABLE = 'bim-viewer-project-permissions'
 
+# --- Secondary indexes (see setup_dynamodb.py) ---
+ISSUES_ID_INDEX = 'id-index'
+ISSUES_CREATED_INDEX = 'projectId-createdAt-index'
+PERMISSIONS_USER_INDEX = 'userId-projectId-index'
+PERMISSIONS_PROJECT_INDEX = 'projectId-index'
+
+# --- Condition builders, built once; .eq()/.begins_with() return new conditions per call ---
+PROJECT_ID_KEY = Key('projectId')
+SORT_KEY_KEY = Key('sortKey')
+USER_ID_KEY = Key('userId')
+ISSUE_ID_KEY = Key('id')
+ISSUE_ID_ATTR = Attr('id')
+ISSUE_FILTER_ATTRS = {name: Attr(name) for name in ('status', 'priority', 'objectId')}
+
+# Project attributes needed to list projects (modelKey is turned into modelUrl)
+PROJECT_LIST_PROJECTION = 'projectId, projectName, modelKey, ownerId, createdAt, updatedAt'
+# Copied onto every permission row so listing a user's projects is a single index query
+PROJECT_SUMMARY_FIELDS = ('projectName', 'modelKey', 'ownerId', 'createdAt', 'updatedAt')
+
+# Issue attributes returned by list endpoints (aliased, since e.g. 'status' is a reserved word)
+ISSUE_LIST_FIELDS = (
+    'id', 'projectId', 'sortKey', 'objectId', 'title', 'description',
+    'author', 'priority', 'status', 'createdAt', 'updatedAt'
+)
+ISSUE_LIST_ATTRIBUTE_NAMES = {f'#f_{field}': field for field in ISSUE_LIST_FIELDS}
+ISSUE_LIST_PROJECTION = ', '.join(ISSUE_LIST_ATTRIBUTE_NAMES)
+
 # --- NEW: Add a check to ensure the S3 bucket name is set ---
 if not S3_BUCKET_NAME:
     raise ValueError("Error: S3_BUCKET_NAME environment variable is not set.")
 
 S3_LOCATION = f'https://{S3_BUCKET_NAME}.s3.amazonaws.com/'
 
-# DynamoDB Configuration
-DYNAMODB_TABLE_NAME = os.environ.get('DYNAMODB_TABLE_NAME', 'bim-viewer-issues')
+# Presigned URLs are reused until shortly before they expire
+PRESIGNED_URL_EXPIRATION = 3600
+PRESIGNED_URL_SAFETY_MARGIN = 300
+PRESIGNED_URL_CACHE_SIZE = 4096
+# Browsers cache model bytes per presigned URL, so keeping them longer than the URL lives buys
+# nothing; no 'immutable', since an upload form can still rewrite its key until it lapses
+MODEL_CACHE_CONTROL = f'private, max-age={PRESIGNED_URL_EXPIRATION}'
+
+# Cognito email -> sub lookups are cached for 10 minutes, misses for 30 seconds
+USER_SUB_CACHE_TTL = 600
+MISSING_USER_CACHE_TTL = 30
+USER_SUB_CACHE_SIZE = 10_000
+
+# Serialized /api/issues/stats bodies per project; dashboards poll it, writes invalidate it
+ISSUE_STATS_CACHE_TTL = 5
+ISSUE_STATS_CACHE_SIZE = 1024
+
+# DynamoDB BatchGetItem accepts at most 100 keys per call
+BATCH_GET_MAX_KEYS = 100
+# Backoff between re-requests of UnprocessedKeys: 50ms doubling up to 1.6s
+BATCH_GET_BASE_DELAY = 0.05
+BATCH_GET_MAX_RETRIES = 6
+
+# Per-project counter item in the issues table, maintained by the issue-stats-stream Lambda.
+# Only read once that Lambda is deployed; otherwise stats are counted on every request.
+ISSUE_STATS_FROM_STREAM = os.environ.get('ISSUE_STATS_FROM_STREAM') == '1'
+STATS_SORT_KEY = 'STATS'
+# seededAt is compared against stream times from another clock, so counters can drift by the
+# writes around a seed; recount them from scratch once they are this old (seconds)
+ISSUE_STATS_RESEED_AFTER = int(os.environ.get('ISSUE_STATS_RESEED_AFTER', 900))
+ISSUE_SORT_KEY_PREFIX = 'ISSUE#'
+
+# Page size for the debug issue listing (?limit=)
+DEBUG_ISSUES_PAGE_SIZE = 100
+DEBUG_ISSUES_MAX_PAGE_SIZE = 1000
+
+# Upper bound on concurrent S3 calls made while listing projects
+PRESIGN_MAX_WORKERS = 16
+
+# --- Request guards ---
+MAX_UPLOAD_BYTES = int(os.environ.get('MAX_UPLOAD_BYTES', 200 * 1024 * 1024))
+MAX_JSON_BODY_BYTES = 1024 * 1024
+ALLOWED_MODEL_MIMETYPES = frozenset(('model/gltf-binary', 'application/octet-stream', ''))
+
+# Browser-direct uploads: presigned POST forms for the model bytes. A pending project row
+# that is never confirmed is expired by DynamoDB TTL (expiresAt) an hour after its form lapses.
+MODEL_CONTENT_TYPE = 'model/gltf-binary'
+UPLOAD_URL_EXPIRATION = 900
+PENDING_UPLOAD_TTL = UPLOAD_URL_EXPIRATION + 3600
+
+# Large models upload as parallel multipart parts; 16 MiB parts with 16 in flight
+# keep the link busy for the 100 MB+ models
+MODEL_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True
+)
+
+# Upper bound on concurrent per-project issue queries in get_all_issues
+ISSUE_QUERY_MAX_WORKERS = 32
+
+# Shared botocore config: keep-alive, a pool big enough for the thread fan-outs, adaptive retries.
+# Size the pool to at least the server's threads per worker times the widest per-request fan-out.
+BOTO_MAX_POOL_CONNECTIONS = int(os.environ.get('BOTO_MAX_POOL_CONNECTIONS', 64))
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=BOTO_MAX_POOL_CONNECTIONS,
+    connect_timeout=3,
+    read_timeout=10,
+    retries={'max_attempts': 4, 'mode': 'adaptive'}
+)
+
+class OrjsonProvider(JSONProvider):
+    """Route jsonify() and request.get_json() through orjson's C encoder/decoder"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=json_serial, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Initialize the Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Werkzeug refuses bodies past this size before reading them
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES
 
 # Setup CORS
 CORS(app, origins=[
@@ -44,60 +180,90 @@ CORS(app, origins=[
     "https://bim-viewer-wewb.onrender.com"
 ])
 
-# Initialize DynamoDB connection
-try:
+def init_aws_clients():
+    """Build the one boto3 session, clients and table handles shared by this process"""
+    global session, dynamodb, dynamodb_client, s3_client, cognito_client, lambda_client
+    global issues_table, projects_table, permissions_table
     session = boto3.Session()
-    dynamodb = session.resource('dynamodb', region_name=AWS_REGION)
-    table = dynamodb.Table(DYNAMODB_TABLE_NAME)
-    table.load()
-    print(f"DynamoDB connection successful! Table: {DYNAMODB_TABLE_NAME}")
-except Exception as e:
-    print(f"DynamoDB connection failed: {e}")
-    table = None
-
-# Initialize S3 Client
-s3_client = session.client('s3')
-cognito_client = session.client('cognito-idp')
-
-issues_table = dynamodb.Table(DYNAMODB_ISSUES_TABLE)
-projects_table = dynamodb.Table(DYNAMODB_PROJECTS_TABLE)
-permissions_table = dynamodb.Table(DYNAMODB_PERMISSIONS_TABLE)
+    dynamodb = session.resource('dynamodb', region_name=AWS_REGION, config=BOTO_CONFIG)
+    # Plain client for hot writes: takes AttributeValues as given. (dynamodb.meta.client is the
+    # resource's client and would marshal already-serialized items a second time.)
+    dynamodb_client = session.client('dynamodb', region_name=AWS_REGION, config=BOTO_CONFIG)
+
+    # Initialize S3 Client
+    s3_client = session.client('s3', config=BOTO_CONFIG)
+    cognito_client = session.client('cognito-idp', config=BOTO_CONFIG)
+    lambda_client = session.client('lambda', config=BOTO_CONFIG)
+
+    issues_table = dynamodb.Table(DYNAMODB_ISSUES_TABLE)
+    projects_table = dynamodb.Table(DYNAMODB_PROJECTS_TABLE)
+    permissions_table = dynamodb.Table(DYNAMODB_PERMISSIONS_TABLE)
+
+# Table handles are lazy: nothing goes over the wire until a handler first uses them
+init_aws_clients()
+
+# Shared marshallers for low-level DynamoDB client calls
+type_serializer = TypeSerializer()
+type_deserializer = TypeDeserializer()
+
+# (bucket, key, expiration) -> (url, reuse_until)
+presigned_url_cache = TTLCache(
+    maxsize=PRESIGNED_URL_CACHE_SIZE,
+    ttl=PRESIGNED_URL_EXPIRATION - PRESIGNED_URL_SAFETY_MARGIN
+)
+presigned_url_cache_lock = threading.Lock()
+
+# Positive S3 existence checks (the compressed model only appears once, then stays)
+existing_object_cache = TTLCache(maxsize=PRESIGNED_URL_CACHE_SIZE, ttl=PRESIGNED_URL_EXPIRATION)
+existing_object_cache_lock = threading.Lock()
+
+# email -> Cognito sub; identities rarely change, so repeat invites skip AdminGetUser
+user_sub_cache = TTLCache(maxsize=USER_SUB_CACHE_SIZE, ttl=USER_SUB_CACHE_TTL)
+# Emails with no account, kept briefly so a freshly signed-up user is found soon after
+missing_user_cache = TTLCache(maxsize=USER_SUB_CACHE_SIZE, ttl=MISSING_USER_CACHE_TTL)
+user_sub_cache_lock = threading.Lock()
+
+# projectId -> JSON bytes of its issue stats
+issue_stats_cache = TTLCache(maxsize=ISSUE_STATS_CACHE_SIZE, ttl=ISSUE_STATS_CACHE_TTL)
+issue_stats_cache_lock = threading.Lock()
 
 # --- Helper Functions ---
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def decimal_to_float(obj):
-    if isinstance(obj, list):
-        return [decimal_to_float(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {key: decimal_to_float(value) for key, value in obj.items()}
-    elif isinstance(obj, Decimal):
-        return float(obj)
-    else:
-        return obj
-
-def serialize_issue(issue):
-    if issue is None:
-        return None
-    serialized = decimal_to_float(issue)
-    if 'createdAt' in serialized:
-        serialized['createdAt'] = serialized['createdAt']
-    if 'updatedAt' in serialized:
-        serialized['updatedAt'] = serialized['updatedAt']
-    return serialized
-
-def validate_issue_data(data):
-    required_fields = ['title', 'description', 'objectId', 'author']
-    for field in required_fields:
-        if field not in data or not data[field].strip():
-            return False, f"Missing or empty field: {field}"
-    if 'priority' in data and data['priority'] not in ['low', 'medium', 'high']:
-        return False, "Priority must be 'low', 'medium', or 'high'"
-    if 'status' in data and data['status'] not in ['open', 'in-progress', 'resolved']:
-        return False, "Status must be 'open', 'in-progress', or 'resolved'"
-    return True, ""
+# --- Request schemas (validated by msgspec while the body is decoded) ---
+class NewIssue(msgspec.Struct):
+    """Body of POST /api/issues"""
+    title: NonBlank
+    description: NonBlank
+    objectId: NonBlank
+    author: NonBlank
+    projectId: NonBlank
+    priority: IssuePriority = 'medium'
+    status: IssueStatus = 'open'
+
+class NewIssueBatch(msgspec.Struct):
+    """Body of POST /api/issues/batch"""
+    issues: Annotated[list[NewIssue], msgspec.Meta(min_length=1, max_length=MAX_BATCH_ISSUES)]
+
+class IssueUpdate(msgspec.Struct):
+    """Body of PUT /api/issues/<id>; projectId/sortKey optionally skip the id index lookup"""
+    title: NonBlank | msgspec.UnsetType = msgspec.UNSET
+    description: NonBlank | msgspec.UnsetType = msgspec.UNSET
+    status: IssueStatus | msgspec.UnsetType = msgspec.UNSET
+    priority: IssuePriority | msgspec.UnsetType = msgspec.UNSET
+    projectId: str | msgspec.UnsetType = msgspec.UNSET
+    sortKey: str | msgspec.UnsetType = msgspec.UNSET
+
+new_issue_decoder = msgspec.json.Decoder(NewIssue)
+new_issue_batch_decoder = msgspec.json.Decoder(NewIssueBatch)
+issue_update_decoder = msgspec.json.Decoder(IssueUpdate)
+
+def set_fields(struct):
+    """The fields of a decoded struct that were present in the request, as a dict"""
+    return {field: value for field, value in msgspec.structs.asdict(struct).items()
+            if value is not msgspec.UNSET}
 
 def json_serial(obj):
     """JSON serializer for objects not serializable by default json code"""
@@ -107,18 +273,260 @@ def json_serial(obj):
         return float(obj)
     raise TypeError(f"Type {type(obj)} not serializable")
 
-def generate_sort_key():
-    return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+def fast_uuid4():
+    """Random (version 4) UUID string in the canonical 8-4-4-4-12 form, without building a uuid.UUID"""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+def model_key_for(project_id):
+    """
+    S3 key for a new upload of a project's model: grouped under the project, with a per-upload
+    id so a replaced model never reuses a key (and a URL) that browsers may have cached. It stays
+    under uploads/ so the compression Lambda fires and writes compressed/<projectId>/<uploadId>.glb.
+    """
+    return f"uploads/{project_id}/{fast_uuid4()}.glb"
+
+def compressed_key_for(model_key):
+    """S3 key the compression Lambda writes the compressed copy of model_key to"""
+    if model_key.startswith('uploads/'):
+        return model_key.replace('uploads/', 'compressed/', 1)
+    return f"compressed/{model_key}"
+
+def serialize_item(item):
+    """Marshal a plain dict into DynamoDB AttributeValues for low-level client calls"""
+    return {key: type_serializer.serialize(value) for key, value in item.items()}
+
+def deserialize_item(item):
+    """Inverse of serialize_item, for items returned by low-level client calls"""
+    return {key: type_deserializer.deserialize(value) for key, value in item.items()}
+
+def json_response(payload, status=200):
+    """Serialize payload once with orjson (Decimal handled via json_serial) into a JSON response"""
+    return app.response_class(
+        orjson.dumps(payload, default=json_serial),
+        status=status,
+        mimetype='application/json'
+    )
+
+def utc_now_iso():
+    """Current UTC time as an ISO-8601 string; the one timestamp format used for stored items"""
+    return datetime.now(timezone.utc).isoformat()
+
+def paginate_pages(operation, **kwargs):
+    """Yield each page of items of a Query/Scan, following LastEvaluatedKey past the 1 MB page limit"""
+    while True:
+        response = operation(**kwargs)
+        yield response.get('Items', [])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return
+        kwargs['ExclusiveStartKey'] = last_key
+
+def paginate(operation, **kwargs):
+    """Yield every item of a Query/Scan across all of its pages"""
+    for page in paginate_pages(operation, **kwargs):
+        yield from page
+
+def stream_json_pages(pages):
+    """
+    Stream pages of items as one JSON array, encoding each page as it arrives, so the first
+    bytes go out after the first DynamoDB round trip and only one page is held at a time.
+    """
+    def generate():
+        yield b'['
+        first = True
+        for page in pages:
+            if not page:
+                continue
+            if not first:
+                yield b','
+            first = False
+            # Encode the whole page in one call and drop its brackets
+            yield orjson.dumps(page, default=json_serial)[1:-1]
+        yield b']'
+    return app.response_class(generate(), status=200, mimetype='application/json')
+
+def encode_cursor(last_key):
+    """Opaque URL-safe page token for a LastEvaluatedKey (None when there are no more pages)"""
+    if not last_key:
+        return None
+    return base64.urlsafe_b64encode(orjson.dumps(last_key, default=json_serial)).decode('ascii')
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; raises ValueError on a malformed token"""
+    try:
+        last_key = orjson.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(last_key, dict):
+        raise ValueError("Invalid cursor")
+    return last_key
+
+def find_issue_key(issue_id):
+    """Look up an issue's composite key (projectId, sortKey) by its id via the id GSI"""
+    response = issues_table.query(
+        IndexName=ISSUES_ID_INDEX,
+        KeyConditionExpression=ISSUE_ID_KEY.eq(issue_id),
+        Limit=1
+    )
+    items = response.get('Items', [])
+    return items[0] if items else None
+
+def build_issue_filter(status=None, priority=None, object_id=None):
+    """AND together the optional status/priority/objectId filters into one FilterExpression (or None)"""
+    filter_expression = None
+    for attr_name, value in (('status', status), ('priority', priority), ('objectId', object_id)):
+        if value:
+            condition = ISSUE_FILTER_ATTRS[attr_name].eq(value)
+            filter_expression = condition if filter_expression is None else filter_expression & condition
+    return filter_expression
+
+def query_project_issues(project_id, filter_expression=None):
+    """Fetch a project's issues newest first via the projectId-createdAt index"""
+    return [issue for page in query_project_issue_pages(project_id, filter_expression) for issue in page]
+
+def query_project_issue_pages(project_id, filter_expression=None):
+    """Page-by-page generator behind query_project_issues"""
+    query_args = {
+        'IndexName': ISSUES_CREATED_INDEX,
+        'KeyConditionExpression': PROJECT_ID_KEY.eq(project_id),
+        'ScanIndexForward': False,  # Most recent first
+        'ProjectionExpression': ISSUE_LIST_PROJECTION,
+        'ExpressionAttributeNames': dict(ISSUE_LIST_ATTRIBUTE_NAMES),
+    }
+    if filter_expression is not None:
+        query_args['FilterExpression'] = filter_expression
+    return paginate_pages(issues_table.query, **query_args)
+
+def batch_get_projects(project_ids):
+    """
+    BatchGetItem all given projects, in 100-key chunks. UnprocessedKeys are re-requested
+    with exponential backoff, since they mean the table is throttling us.
+    """
+    projects = []
+    for start in range(0, len(project_ids), BATCH_GET_MAX_KEYS):
+        request_items = {
+            DYNAMODB_PROJECTS_TABLE: {
+                'Keys': [{'projectId': {'S': pid}} for pid in project_ids[start:start + BATCH_GET_MAX_KEYS]],
+                'ProjectionExpression': PROJECT_LIST_PROJECTION
+            }
+        }
+        attempt = 0
+        while request_items:
+            if attempt:
+                if attempt > BATCH_GET_MAX_RETRIES:
+                    unprocessed = len(request_items[DYNAMODB_PROJECTS_TABLE]['Keys'])
+                    print(f"Giving up on {unprocessed} unprocessed project keys")
+                    break
+                time.sleep(BATCH_GET_BASE_DELAY * (2 ** (attempt - 1)))
+            # Low-level client: UnprocessedKeys come back already marshalled for the retry
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+            projects.extend(
+                deserialize_item(item)
+                for item in response.get('Responses', {}).get(DYNAMODB_PROJECTS_TABLE, [])
+            )
+            request_items = response.get('UnprocessedKeys')
+            attempt += 1
+    return projects
+
+def count_project_issues(project_id, filter_expression=None):
+    """Count a project's issues with Select='COUNT', following LastEvaluatedKey across pages"""
+    query_args = {
+        # Only issue rows; the project's STATS counter item shares the partition
+        'KeyConditionExpression': PROJECT_ID_KEY.eq(project_id) &
+                                  SORT_KEY_KEY.begins_with(ISSUE_SORT_KEY_PREFIX),
+        'Select': 'COUNT',
+        # Strongly consistent, so a seeded STATS item includes every write acknowledged before it
+        'ConsistentRead': True,
+    }
+    if filter_expression is not None:
+        query_args['FilterExpression'] = filter_expression
+    count = 0
+    while True:
+        response = issues_table.query(**query_args)
+        count += response.get('Count', 0)
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return count
+        query_args['ExclusiveStartKey'] = last_key
+
+def resolve_issue_key(issue_id, source):
+    """
+    Return the issue's (projectId, sortKey), taking them from source (request body/args)
+    when both are provided and skipping the index lookup. Writes using a client-provided
+    key must carry ConditionExpression=Attr('id').eq(issue_id).
+    """
+    project_id = source.get('projectId')
+    sort_key = source.get('sortKey')
+    if isinstance(project_id, str) and isinstance(sort_key, str) and project_id and sort_key:
+        return {'projectId': project_id, 'sortKey': sort_key, 'id': issue_id}
+    return find_issue_key(issue_id)
 
 # --- NEW: Helper function to check if user has project access ---
+def find_user_permission(user_sub, project_id):
+    """Return the user's permission row for a project (or None) via a userId+projectId key lookup"""
+    permissions_response = permissions_table.query(
+        IndexName=PERMISSIONS_USER_INDEX,
+        KeyConditionExpression=USER_ID_KEY.eq(user_sub) &
+                               PROJECT_ID_KEY.eq(project_id),
+        Limit=1
+    )
+    items = permissions_response.get('Items', [])
+    return items[0] if items else None
+
+def query_project_permissions(project_id):
+    """Fetch every permission row of a project via the projectId index"""
+    return list(paginate(
+        permissions_table.query,
+        IndexName=PERMISSIONS_PROJECT_INDEX,
+        KeyConditionExpression=PROJECT_ID_KEY.eq(project_id)
+    ))
+
+def project_summary(project):
+    """The project attributes denormalized onto its permission rows"""
+    return {field: project[field] for field in PROJECT_SUMMARY_FIELDS if field in project}
+
+def query_user_projects(user_sub):
+    """The user's permission rows, each carrying its project's summary fields"""
+    return list(paginate(
+        permissions_table.query,
+        IndexName=PERMISSIONS_USER_INDEX,
+        KeyConditionExpression=USER_ID_KEY.eq(user_sub),
+        ProjectionExpression=PROJECT_LIST_PROJECTION
+    ))
+
+def sync_permission_summaries(project_id, fields):
+    """Fan a project metadata change out to all of its permission rows"""
+    update_expression = 'SET ' + ', '.join(f'#{field} = :{field}' for field in fields)
+    for permission in query_project_permissions(project_id):
+        try:
+            permissions_table.update_item(
+                Key={'permissionId': permission['permissionId']},
+                UpdateExpression=update_expression,
+                ConditionExpression='attribute_exists(permissionId)',
+                ExpressionAttributeNames={f'#{field}': field for field in fields},
+                ExpressionAttributeValues={f':{field}': value for field, value in fields.items()}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                print(f"Warning: Could not update permission {permission['permissionId']}: {e}")
+
+def query_user_project_ids(user_sub):
+    """Ids of every project the user has a permission row for, via the userId index"""
+    return [perm['projectId'] for perm in paginate(
+        permissions_table.query,
+        IndexName=PERMISSIONS_USER_INDEX,
+        KeyConditionExpression=USER_ID_KEY.eq(user_sub),
+        ProjectionExpression='projectId'
+    )]
+
 def user_has_project_access(user_sub, project_id):
     """Check if user has access to a project"""
     try:
-        permissions_response = permissions_table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('projectId').eq(project_id) & 
-                           boto3.dynamodb.conditions.Attr('userId').eq(user_sub)
-        )
-        return len(permissions_response.get('Items', [])) > 0
+        return find_user_permission(user_sub, project_id) is not None
     except Exception as e:
         print(f"Error checking project access: {e}")
         return False
@@ -129,6 +537,15 @@ def check_user_exists(email):
     Check if a user exists in Cognito User Pool by email.
     Returns (exists: bool, user_sub: str|None, error: str|None)
     """
+    cache_key = email.strip().lower()
+    with user_sub_cache_lock:
+        cached_sub = user_sub_cache.get(cache_key)
+        known_missing = cache_key in missing_user_cache
+    if cached_sub:
+        return True, cached_sub, None
+    if known_missing:
+        return False, None, "User has not created an account"
+
     try:
         # Use AdminGetUser with email as username
         response = cognito_client.admin_get_user(
@@ -143,20 +560,59 @@ def check_user_exists(email):
                 user_sub = attr['Value']
                 break
         
+        if user_sub:
+            with user_sub_cache_lock:
+                user_sub_cache[cache_key] = user_sub
         return True, user_sub, None
         
     except ClientError as e:
         if e.response['Error']['Code'] == 'UserNotFoundException':
+            with user_sub_cache_lock:
+                missing_user_cache[cache_key] = True
             return False, None, "User has not created an account"
         else:
             return False, None, f"Error checking user: {e}"
     except Exception as e:
         return False, None, f"Unexpected error: {e}"
 
+# --- Request Guards ---
+@app.before_request
+def reject_oversized_or_malformed():
+    """Reject bad POST/PUT bodies from their headers alone, before any of the body is read"""
+    if request.method not in ('POST', 'PUT'):
+        return None
+    content_length = request.content_length or 0
+    if request.endpoint == 'create_project':
+        if content_length > MAX_UPLOAD_BYTES:
+            return jsonify(error="Uploaded model is too large"), 413
+        if request.mimetype != 'multipart/form-data':
+            return jsonify(error="Project creation expects multipart/form-data"), 415
+        return None
+    if content_length > MAX_JSON_BODY_BYTES:
+        return jsonify(error="Request body is too large"), 413
+    if content_length and not request.is_json:
+        return jsonify(error="Request body must be application/json"), 415
+    return None
+
 # --- API Endpoints ---
 
+def generate_presigned_url(bucket_name, object_key, expiration=PRESIGNED_URL_EXPIRATION):
+    """Return a presigned URL for an S3 object, reusing a cached one while it is still fresh"""
+    cache_key = (bucket_name, object_key, expiration)
+    now = time.monotonic()
+    with presigned_url_cache_lock:
+        cached = presigned_url_cache.get(cache_key)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    url = _sign_presigned_url(bucket_name, object_key, expiration)
+    if url and expiration > PRESIGNED_URL_SAFETY_MARGIN:
+        with presigned_url_cache_lock:
+            presigned_url_cache[cache_key] = (url, now + expiration - PRESIGNED_URL_SAFETY_MARGIN)
+    return url
+
 # FIXED: Add better error handling and validation
-def generate_presigned_url(bucket_name, object_key, expiration=3600):
+def _sign_presigned_url(bucket_name, object_key, expiration):
     """Generate a presigned URL for S3 object"""
     try:
         # Validate inputs
@@ -166,22 +622,14 @@ def generate_presigned_url(bucket_name, object_key, expiration=3600):
             
         print(f"Generating presigned URL for: {bucket_name}/{object_key}")
         
-        # Check if object exists
-        try:
-            s3_client.head_object(Bucket=bucket_name, Key=object_key)
-            print(f"✅ Object found: {object_key}")
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                print(f"❌ Object not found: {object_key}")
-                return None
-            else:
-                print(f"❌ Error checking object existence: {e}")
-                return None
-        
-        # Generate presigned URL
+        # Generate presigned URL (local signing only; existence is not checked here)
         response = s3_client.generate_presigned_url(
             'get_object',
-            Params={'Bucket': bucket_name, 'Key': object_key},
+            Params={
+                'Bucket': bucket_name,
+                'Key': object_key,
+                'ResponseCacheControl': MODEL_CACHE_CONTROL
+            },
             ExpiresIn=expiration
         )
         print(f"✅ Generated presigned URL: {response[:100]}...")
@@ -193,6 +641,74 @@ def generate_presigned_url(bucket_name, object_key, expiration=3600):
         print(f"❌ Unexpected error generating presigned URL: {e}")
         return None
 
+def object_exists(bucket_name, object_key, strict=False):
+    """
+    HEAD an S3 object, remembering objects that exist so later checks are free.
+    Errors other than 404 count as missing unless strict=True, which re-raises them.
+    """
+    cache_key = (bucket_name, object_key)
+    with existing_object_cache_lock:
+        if cache_key in existing_object_cache:
+            return True
+    try:
+        s3_client.head_object(Bucket=bucket_name, Key=object_key)
+        print(f"✅ Object found: {object_key}")
+    except ClientError as e:
+        if e.response['Error']['Code'] == '404':
+            print(f"❌ Object not found: {object_key}")
+        elif strict:
+            raise
+        else:
+            print(f"❌ Error checking object existence: {e}")
+        return False
+    with existing_object_cache_lock:
+        existing_object_cache[cache_key] = True
+    return True
+
+def attach_model_url(project):
+    """Set project['modelUrl'], preferring the compressed model. Returns None if no URL can be made."""
+    if 'modelKey' not in project:
+        print(f"Warning: Project {project.get('projectId', 'unknown')} has no modelKey")
+        return None
+
+    print(f"Processing project: {project.get('projectId', 'unknown')}")
+    print(f"Original modelKey: {project['modelKey']}")
+
+    # Try compressed file first
+    compressed_key = compressed_key_for(project['modelKey'])
+
+    presigned_url = None
+    if object_exists(S3_BUCKET_NAME, compressed_key):
+        presigned_url = generate_presigned_url(S3_BUCKET_NAME, compressed_key)
+    if presigned_url:
+        print(f"Using compressed file: {compressed_key}")
+        project['modelUrl'] = presigned_url
+        return project
+
+    # Fallback to original if compressed doesn't exist
+    presigned_url = generate_presigned_url(S3_BUCKET_NAME, project['modelKey'])
+    if presigned_url:
+        print(f"Using original file: {project['modelKey']}")
+        project['modelUrl'] = presigned_url
+        return project
+
+    print(f"Warning: Could not generate presigned URL for project {project.get('projectId', 'unknown')}")
+    return None
+
+# Shared pool for the per-project S3 lookups in get_projects, so a request doesn't spin up its own threads
+presign_executor = ThreadPoolExecutor(max_workers=PRESIGN_MAX_WORKERS, thread_name_prefix='presign')
+
+def reinit_after_fork():
+    """
+    A forked child (e.g. gunicorn --preload) must not share the parent's pooled sockets,
+    and it inherits none of its threads, so rebuild the clients and the thread pool.
+    """
+    global presign_executor
+    init_aws_clients()
+    presign_executor = ThreadPoolExecutor(max_workers=PRESIGN_MAX_WORKERS, thread_name_prefix='presign')
+
+os.register_at_fork(after_in_child=reinit_after_fork)
+
 # Modified create_project endpoint
 @app.route('/api/projects', methods=['POST'])
 @token_required
@@ -206,15 +722,12 @@ def create_project(current_user_sub):
     if file.filename == '' or not allowed_file(file.filename):
         return jsonify(error="Invalid or no file selected"), 400
 
-    filename = f"uploads/{uuid.uuid4()}-{secure_filename(file.filename)}"
-    
-    try:
-        s3_client.upload_fileobj(file, S3_BUCKET_NAME, filename)
-    except ClientError as e:
-        return jsonify(error=f"Failed to upload model: {e}"), 500
+    if file.mimetype not in ALLOWED_MODEL_MIMETYPES:
+        return jsonify(error="Model must be a binary glTF (.glb) file"), 415
 
-    project_id = str(uuid.uuid4())
-    created_at = datetime.now(timezone.utc).isoformat()
+    project_id = fast_uuid4()
+    filename = model_key_for(project_id)
+    created_at = utc_now_iso()
     
     # --- MODIFIED: Store the permanent S3 key, NOT the temporary URL ---
     project = {
@@ -226,72 +739,207 @@ def create_project(current_user_sub):
     }
 
     permission = {
-        'permissionId': str(uuid.uuid4()),
+        'permissionId': fast_uuid4(),
         'projectId': project_id,
         'userId': current_user_sub,
         'role': 'owner',
+        **project_summary(project),
     }
-    
+
+    try:
+        s3_client.upload_fileobj(file.stream, S3_BUCKET_NAME, filename, Config=MODEL_UPLOAD_CONFIG)
+    except (ClientError, S3UploadFailedError) as e:
+        return jsonify(error=f"Failed to upload model: {e}"), 500
+
     try:
-        projects_table.put_item(Item=project)
-        permissions_table.put_item(Item=permission)
+        # Project and owner permission are written atomically in one round trip
+        dynamodb_client.transact_write_items(TransactItems=[
+            {'Put': {
+                'TableName': DYNAMODB_PROJECTS_TABLE,
+                'Item': serialize_item(project),
+                'ConditionExpression': 'attribute_not_exists(projectId)'
+            }},
+            {'Put': {
+                'TableName': DYNAMODB_PERMISSIONS_TABLE,
+                'Item': serialize_item(permission),
+                'ConditionExpression': 'attribute_not_exists(permissionId)'
+            }}
+        ])
     except ClientError as e:
+        # Nothing references the model yet, so don't leave it behind
+        try:
+            s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=filename)
+        except ClientError as cleanup_error:
+            print(f"Warning: Could not remove orphaned model {filename}: {cleanup_error}")
         return jsonify(error=f"Failed to create project records: {e}"), 500
 
+    attach_model_url(project)
+    return jsonify(project), 201
+
+@app.route('/api/projects/init', methods=['POST'])
+@token_required
+def init_project_upload(current_user_sub):
+    """
+    Starts a browser-direct upload: allocates the project and its S3 key and returns a
+    presigned POST form (url + fields). The project becomes visible once
+    /api/projects/<id>/confirm is called.
+    Expects a JSON payload with "projectName" and "fileName".
+    """
+    data = request.get_json()
+    project_name = data.get('projectName') if isinstance(data, dict) else None
+    file_name = data.get('fileName') if isinstance(data, dict) else None
+    if not isinstance(project_name, str) or not project_name.strip() or \
+            not isinstance(file_name, str) or not file_name:
+        return jsonify(error="Request must include 'projectName' and 'fileName'"), 400
+
+    if not allowed_file(file_name):
+        return jsonify(error="Invalid file type"), 400
+
+    project_id = fast_uuid4()
+    project = {
+        'projectId': project_id,
+        'projectName': project_name.strip(),
+        'modelKey': model_key_for(project_id),
+        'ownerId': current_user_sub,
+        'createdAt': utc_now_iso(),
+        'uploadStatus': 'pending',
+        'expiresAt': int(time.time()) + PENDING_UPLOAD_TTL,
+    }
+
+    try:
+        # The POST policy makes S3 itself enforce the size cap and the exact content type
+        upload = s3_client.generate_presigned_post(
+            Bucket=S3_BUCKET_NAME,
+            Key=project['modelKey'],
+            Fields={'Content-Type': MODEL_CONTENT_TYPE},
+            Conditions=[
+                {'Content-Type': MODEL_CONTENT_TYPE},
+                ['content-length-range', 1, MAX_UPLOAD_BYTES],
+            ],
+            ExpiresIn=UPLOAD_URL_EXPIRATION
+        )
+        # Pending row only; without a permission row it is not listed anywhere yet
+        projects_table.put_item(Item=project, ConditionExpression='attribute_not_exists(projectId)')
+    except ClientError as e:
+        return jsonify(error=f"Failed to start upload: {e}"), 500
+
+    return jsonify(
+        projectId=project['projectId'],
+        modelKey=project['modelKey'],
+        uploadUrl=upload['url'],
+        uploadFields=upload['fields'],
+        maxBytes=MAX_UPLOAD_BYTES,
+        expiresIn=UPLOAD_URL_EXPIRATION
+    ), 201
+
+def discard_pending_project(project):
+    """Delete an unconfirmed project's row, model and permissions, so none is left orphaned"""
+    try:
+        # The row goes first: if a confirm won the race, the project is kept whole
+        projects_table.delete_item(
+            Key={'projectId': project['projectId']},
+            ConditionExpression='uploadStatus = :pending',
+            ExpressionAttributeValues={':pending': 'pending'}
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            print(f"Warning: Could not discard pending project {project['projectId']}: {e}")
+        return
+
+    try:
+        s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=project['modelKey'])
+    except ClientError as e:
+        print(f"Warning: Could not delete model of discarded project {project['projectId']}: {e}")
+    delete_project_permissions(project['projectId'])
+
+@app.route('/api/projects/<project_id>/confirm', methods=['POST'])
+@token_required
+def confirm_project_upload(current_user_sub, project_id):
+    """Finalizes a browser-direct upload: checks the object landed, then grants the owner permission."""
+    try:
+        project = projects_table.get_item(Key={'projectId': project_id}).get('Item')
+    except ClientError as e:
+        return jsonify(error=f"Database error: {e}"), 500
+
+    if not project or project.get('ownerId') != current_user_sub:
+        return jsonify(error="Project not found"), 404
+    if project.get('uploadStatus') != 'pending':
+        return jsonify(error="Project upload is already confirmed"), 409
+    # TTL deletion can lag by hours, so don't confirm a row that has already lapsed
+    if 'expiresAt' in project and project['expiresAt'] <= time.time():
+        discard_pending_project(project)
+        return jsonify(error="Upload has expired, please start again"), 410
+
+    try:
+        head = s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=project['modelKey'])
+    except ClientError as e:
+        if e.response['Error']['Code'] == '404':
+            return jsonify(error="Model has not been uploaded yet"), 400
+        return jsonify(error=f"Failed to verify upload: {e}"), 500
+
+    # The POST policy already caps the size; this catches objects written any other way
+    if head['ContentLength'] > MAX_UPLOAD_BYTES:
+        discard_pending_project(project)
+        return jsonify(error="Uploaded model is too large"), 413
+
+    permission = {
+        'permissionId': fast_uuid4(),
+        'projectId': project_id,
+        'userId': current_user_sub,
+        'role': 'owner',
+        **project_summary(project),
+    }
+
+    try:
+        # Flip the project to ready and create the owner permission atomically
+        dynamodb_client.transact_write_items(TransactItems=[
+            {'Update': {
+                'TableName': DYNAMODB_PROJECTS_TABLE,
+                'Key': serialize_item({'projectId': project_id}),
+                'UpdateExpression': 'REMOVE uploadStatus, expiresAt',
+                'ConditionExpression': 'uploadStatus = :pending AND ownerId = :owner',
+                'ExpressionAttributeValues': serialize_item({':pending': 'pending', ':owner': current_user_sub})
+            }},
+            {'Put': {
+                'TableName': DYNAMODB_PERMISSIONS_TABLE,
+                'Item': serialize_item(permission),
+                'ConditionExpression': 'attribute_not_exists(permissionId)'
+            }}
+        ])
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'TransactionCanceledException':
+            return jsonify(error="Project upload is already confirmed"), 409
+        return jsonify(error=f"Failed to create project records: {e}"), 500
+
+    project.pop('uploadStatus', None)
+    project.pop('expiresAt', None)
+    # Hand back a model URL so the client can list the project without another fetch
+    attach_model_url(project)
     return jsonify(project), 201
 
 @app.route('/api/projects', methods=['GET'])
 @token_required
 def get_projects(current_user_sub):
     try:
-        permissions_response = permissions_table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('userId').eq(current_user_sub)
-        )
-        project_ids = [perm['projectId'] for perm in permissions_response.get('Items', [])]
+        project_details = query_user_projects(current_user_sub)
 
-        if not project_ids:
+        if not project_details:
             return jsonify([])
-        
-        batch_keys = {'Keys': [{'projectId': pid} for pid in project_ids]}
-        projects_response = dynamodb.batch_get_item(RequestItems={DYNAMODB_PROJECTS_TABLE: batch_keys})
-        
-        project_details = projects_response.get('Responses', {}).get(DYNAMODB_PROJECTS_TABLE, [])
 
-        # --- Prefer compressed file over original ---
-        valid_projects = []
-        for project in project_details:
-            if 'modelKey' in project:
-                print(f"Processing project: {project.get('projectId', 'unknown')}")
-                print(f"Original modelKey: {project['modelKey']}")
-                
-                # Try compressed file first
-                if project['modelKey'].startswith('uploads/'):
-                    compressed_key = project['modelKey'].replace('uploads/', 'compressed/')
-                else:
-                    compressed_key = f"compressed/{project['modelKey']}"
-                
-                presigned_url = generate_presigned_url(S3_BUCKET_NAME, compressed_key)
-                if presigned_url:
-                    print(f"Using compressed file: {compressed_key}")
-                    project['modelUrl'] = presigned_url
-                    valid_projects.append(project)
-                else:
-                    # Fallback to original if compressed doesn't exist
-                    presigned_url = generate_presigned_url(S3_BUCKET_NAME, project['modelKey'])
-                    if presigned_url:
-                        print(f"Using original file: {project['modelKey']}")
-                        project['modelUrl'] = presigned_url
-                        valid_projects.append(project)
-                    else:
-                        print(f"Warning: Could not generate presigned URL for project {project.get('projectId', 'unknown')}")
-                        continue
-            else:
-                print(f"Warning: Project {project.get('projectId', 'unknown')} has no modelKey")
-                continue
+        # Permission rows written before project metadata was denormalized onto them
+        # still need the project read
+        legacy_ids = [perm['projectId'] for perm in project_details if 'modelKey' not in perm]
+        if legacy_ids:
+            project_details = [perm for perm in project_details if 'modelKey' in perm]
+            project_details.extend(batch_get_projects(legacy_ids))
+
+        # --- Prefer compressed file over original, resolving URLs concurrently ---
+        resolved = presign_executor.map(attach_model_url, project_details)
+        valid_projects = [project for project in resolved if project]
 
         sorted_projects = sorted(valid_projects, key=lambda p: p['createdAt'], reverse=True)
         
-        return jsonify(json.loads(json.dumps(sorted_projects, default=json_serial))), 200
+        return json_response(sorted_projects, 200)
     except ClientError as e:
         print(f"DynamoDB error: {e}")
         return jsonify(error=f"Could not retrieve projects: {e}"), 500
@@ -304,39 +952,32 @@ def get_projects(current_user_sub):
 @token_required
 def get_project(current_user_sub, project_id):
     try:
+        # The access check and the project read are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            access_future = executor.submit(user_has_project_access, current_user_sub, project_id)
+            project_future = executor.submit(projects_table.get_item, Key={'projectId': project_id})
+
         # Check if user has permission to access this project
-        if not user_has_project_access(current_user_sub, project_id):
+        if not access_future.result():
             return jsonify(error="Project not found or access denied"), 404
         
         # Get project details
-        project_response = projects_table.get_item(Key={'projectId': project_id})
-        project = project_response.get('Item')
+        project = project_future.result().get('Item')
         
         if not project:
             return jsonify(error="Project not found"), 404
         
-        # Generate fresh presigned URL
-        if 'modelKey' in project:
-            # Always try original file first (for immediate access after creation)
-            presigned_url = generate_presigned_url(S3_BUCKET_NAME, project['modelKey'])
-            if presigned_url:
-                project['modelUrl'] = presigned_url
-            else:
-                # Fallback to compressed if original doesn't exist
-                if project['modelKey'].startswith('uploads/'):
-                    compressed_key = project['modelKey'].replace('uploads/', 'compressed/')
-                else:
-                    compressed_key = f"compressed/{project['modelKey']}"
-                
-                presigned_url = generate_presigned_url(S3_BUCKET_NAME, compressed_key)
-                if presigned_url:
-                    project['modelUrl'] = presigned_url
-                else:
-                    return jsonify(error="Could not generate access URL for model"), 500
-        else:
+        if 'modelKey' not in project:
             return jsonify(error="Project has no associated model"), 500
+
+        # Same choice as the project list: compressed model once it exists, else the original
+        if not attach_model_url(project):
+            return jsonify(error="Could not generate access URL for model"), 500
         
-        return jsonify(json.loads(json.dumps(project, default=json_serial))), 200
+        response = json_response(project, 200)
+        # Name, access and the compressed-model switch can change at any time; only the model bytes are cacheable
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
         
     except ClientError as e:
         print(f"DynamoDB error: {e}")
@@ -377,12 +1018,16 @@ def update_project(current_user_sub, project_id):
                 UpdateExpression='SET projectName = :name, updatedAt = :updated_at',
                 ExpressionAttributeValues={
                     ':name': new_name,
-                    ':updated_at': datetime.now(timezone.utc).isoformat()
+                    ':updated_at': utc_now_iso()
                 },
                 ReturnValues='ALL_NEW'
             )
             
             updated_project = update_response.get('Attributes')
+            sync_permission_summaries(project_id, {
+                'projectName': updated_project['projectName'],
+                'updatedAt': updated_project['updatedAt']
+            })
             
             # Generate fresh presigned URL for the updated project
             if 'modelKey' in updated_project:
@@ -390,7 +1035,7 @@ def update_project(current_user_sub, project_id):
                 if presigned_url:
                     updated_project['modelUrl'] = presigned_url
             
-            return jsonify(json.loads(json.dumps(updated_project, default=json_serial))), 200
+            return json_response(updated_project, 200)
         else:
             return jsonify(error="No valid fields to update"), 400
             
@@ -401,6 +1046,53 @@ def update_project(current_user_sub, project_id):
         print(f"Unexpected error: {e}")
         return jsonify(error="An unexpected error occurred"), 500
 
+def delete_project_permissions(project_id):
+    """Remove every permission row for a project"""
+    try:
+        # batch_writer groups the deletes into 25-item BatchWriteItem calls
+        with permissions_table.batch_writer() as batch:
+            for permission in query_project_permissions(project_id):
+                batch.delete_item(Key={'permissionId': permission['permissionId']})
+    except Exception as e:
+        print(f"Warning: Could not delete project permissions: {e}")
+
+def delete_project_issues(project_id):
+    """Remove every issue belonging to a project"""
+    try:
+        # Collect every key first so deletes don't shift the pages being read
+        issues = list(paginate(
+            issues_table.query,
+            KeyConditionExpression=PROJECT_ID_KEY.eq(project_id),
+            ProjectionExpression='sortKey'
+        ))
+        with issues_table.batch_writer() as batch:
+            for issue in issues:
+                batch.delete_item(Key={'projectId': project_id, 'sortKey': issue['sortKey']})
+        invalidate_issue_stats(project_id)
+    except Exception as e:
+        print(f"Warning: Could not delete project issues: {e}")
+
+def delete_project_files(project):
+    """Delete a project's model from S3 (both original and compressed)"""
+    try:
+        if 'modelKey' in project:
+            # Delete original file
+            s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=project['modelKey'])
+            
+            # Delete compressed file if it exists
+            compressed_key = compressed_key_for(project['modelKey'])
+            
+            with existing_object_cache_lock:
+                existing_object_cache.pop((S3_BUCKET_NAME, compressed_key), None)
+            
+            try:
+                s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=compressed_key)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'NoSuchKey':
+                    print(f"Warning: Could not delete compressed file: {e}")
+    except Exception as e:
+        print(f"Warning: Could not delete S3 files: {e}")
+
 # ADDED: Delete project endpoint
 @app.route('/api/projects/<project_id>', methods=['DELETE'])
 @token_required
@@ -419,47 +1111,11 @@ def delete_project(current_user_sub, project_id):
         # Delete the project from DynamoDB
         projects_table.delete_item(Key={'projectId': project_id})
         
-        # Delete project permissions
-        try:
-            permissions_response = permissions_table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr('projectId').eq(project_id)
-            )
-            for permission in permissions_response.get('Items', []):
-                permissions_table.delete_item(Key={'permissionId': permission['permissionId']})
-        except Exception as e:
-            print(f"Warning: Could not delete project permissions: {e}")
-        
-        # Delete associated issues
-        try:
-            issues_response = issues_table.query(
-                KeyConditionExpression=boto3.dynamodb.conditions.Key('projectId').eq(project_id)
-            )
-            for issue in issues_response.get('Items', []):
-                issues_table.delete_item(
-                    Key={'projectId': project_id, 'sortKey': issue['sortKey']}
-                )
-        except Exception as e:
-            print(f"Warning: Could not delete project issues: {e}")
-        
-        # Delete files from S3 (both original and compressed)
-        try:
-            if 'modelKey' in project:
-                # Delete original file
-                s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=project['modelKey'])
-                
-                # Delete compressed file if it exists
-                if project['modelKey'].startswith('uploads/'):
-                    compressed_key = project['modelKey'].replace('uploads/', 'compressed/')
-                else:
-                    compressed_key = f"compressed/{project['modelKey']}"
-                
-                try:
-                    s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=compressed_key)
-                except ClientError as e:
-                    if e.response['Error']['Code'] != 'NoSuchKey':
-                        print(f"Warning: Could not delete compressed file: {e}")
-        except Exception as e:
-            print(f"Warning: Could not delete S3 files: {e}")
+        # Permissions, issues and S3 files are independent; clean them up concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            executor.submit(delete_project_permissions, project_id)
+            executor.submit(delete_project_issues, project_id)
+            executor.submit(delete_project_files, project)
         
         return jsonify(message="Project deleted successfully"), 200
         
@@ -484,7 +1140,7 @@ def check_user():
     email = data['email']
     
     # Validate email format (basic check)
-    if '@' not in email or '.' not in email:
+    if not isinstance(email, str) or not EMAIL_RE.match(email):
         return jsonify({'error': 'Invalid email format'}), 400
 
     exists, user_sub, error = check_user_exists(email)
@@ -507,23 +1163,32 @@ def invite_user_to_project(current_user_sub, project_id):
     """
     Invites a user (by email) to collaborate on a project.
     """
-    # 1. Check if the current user is the owner of the project
-    try:
-        project_item = projects_table.get_item(Key={'projectId': project_id}).get('Item')
-        if not project_item or project_item.get('ownerId') != current_user_sub:
-            return jsonify(error="Not authorized to share this project"), 403
-    except ClientError as e:
-        return jsonify(error=f"Database error: {e}"), 500
-
-    # 2. Get the email of the user to invite from the request body
+    # 1. Get the email of the user to invite from the request body
     data = request.get_json()
     if not data or 'email' not in data:
         return jsonify(error="Email of the user to invite is required"), 400
     
     invitee_email = data['email']
+    if not isinstance(invitee_email, str) or not EMAIL_RE.match(invitee_email):
+        return jsonify(error="Invalid email format"), 400
+
+    # The ownership check and the Cognito lookup are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        project_future = executor.submit(projects_table.get_item, Key={'projectId': project_id})
+        user_future = executor.submit(check_user_exists, invitee_email)
+
+    # 2. Check if the current user is the owner of the project
+    try:
+        project_item = project_future.result().get('Item')
+        if not project_item or project_item.get('ownerId') != current_user_sub:
+            return jsonify(error="Not authorized to share this project"), 403
+        if project_item.get('uploadStatus') == 'pending':
+            return jsonify(error="Project upload is not confirmed yet"), 409
+    except ClientError as e:
+        return jsonify(error=f"Database error: {e}"), 500
 
     # 3. Check if the user exists using our helper function
-    exists, invitee_sub, error = check_user_exists(invitee_email)
+    exists, invitee_sub, error = user_future.result()
     
     if error:
         if "User has not created an account" in error:
@@ -536,12 +1201,7 @@ def invite_user_to_project(current_user_sub, project_id):
 
     # 4. Check if user is already invited to this project
     try:
-        existing_permission = permissions_table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('projectId').eq(project_id) & 
-                           boto3.dynamodb.conditions.Attr('userId').eq(invitee_sub)
-        )
-        
-        if existing_permission.get('Items', []):
+        if find_user_permission(invitee_sub, project_id):
             return jsonify(error=f"User {invitee_email} is already invited to this project"), 400
             
     except ClientError as e:
@@ -549,44 +1209,28 @@ def invite_user_to_project(current_user_sub, project_id):
 
     # 5. Create the new permission in DynamoDB
     permission = {
-        'permissionId': str(uuid.uuid4()),
+        'permissionId': fast_uuid4(),
         'projectId': project_id,
         'userId': invitee_sub,
-        'role': 'collaborator' # Assign the 'collaborator' role
+        'role': 'collaborator', # Assign the 'collaborator' role
+        **project_summary(project_item),
     }
     
     try:
-        permissions_table.put_item(Item=permission)
+        permissions_table.put_item(Item=permission, ConditionExpression='attribute_not_exists(permissionId)')
     except ClientError as e:
         return jsonify(error=f"Failed to save permission: {e}"), 500
 
     return jsonify(message=f"Successfully invited {invitee_email} to the project"), 200
 
 
-@app.route('/api/issues', methods=['POST'])
-@token_required
-def create_issue(current_user_sub):
-    data = request.get_json()
-    
-    # Validate required fields
-    required_fields = ['title', 'description', 'objectId', 'author', 'projectId']
-    if not data or not all(field in data for field in required_fields):
-        return jsonify(error="Missing required fields: title, description, objectId, author, projectId"), 400
-
-    # Check if user has access to the project
-    if not user_has_project_access(current_user_sub, data['projectId']):
-        return jsonify(error="Access denied to this project"), 403
-
-    # Validate data
-    is_valid, error_msg = validate_issue_data(data)
-    if not is_valid:
-        return jsonify(error=error_msg), 400
-
-    issue_id = str(uuid.uuid4())
-    created_at = datetime.now(timezone.utc).isoformat()
+def build_issue_item(data, current_user_sub):
+    """Build the DynamoDB item for a new, already validated issue"""
+    issue_id = fast_uuid4()
+    created_at = utc_now_iso()
     
     # FIXED: Create issue with projectId as partition key
-    issue = {
+    return {
         'projectId': data['projectId'],  # Partition key
         'sortKey': f"ISSUE#{issue_id}#{created_at}",  # Sort key
         'id': issue_id,  # Unique identifier for the issue
@@ -600,11 +1244,31 @@ def create_issue(current_user_sub):
         'updatedAt': created_at,
         'owner_sub': current_user_sub
     }
+
+@app.route('/api/issues', methods=['POST'])
+@token_required
+def create_issue(current_user_sub):
+    # Decode and validate in one pass
+    try:
+        data = msgspec.structs.asdict(new_issue_decoder.decode(request.get_data()))
+    except msgspec.DecodeError as e:
+        return jsonify(error=f"Invalid issue: {e}"), 400
+
+    # Check if user has access to the project
+    if not user_has_project_access(current_user_sub, data['projectId']):
+        return jsonify(error="Access denied to this project"), 403
+
+    issue = build_issue_item(data, current_user_sub)
     
     try:
-        issues_table.put_item(Item=issue)
+        dynamodb_client.put_item(
+            TableName=DYNAMODB_ISSUES_TABLE,
+            Item=serialize_item(issue),
+            ConditionExpression='attribute_not_exists(sortKey)'
+        )
+        invalidate_issue_stats(issue['projectId'])
         print(f"Created issue: {issue}")
-        return jsonify(json.loads(json.dumps(serialize_issue(issue), default=json_serial))), 201
+        return json_response(issue, 201)
     except ClientError as e:
         print(f"DynamoDB error creating issue: {e}")
         return jsonify(error="Database error occurred"), 500
@@ -613,27 +1277,63 @@ def create_issue(current_user_sub):
         return jsonify(error="Failed to create issue"), 500
 
 
+@app.route('/api/issues/batch', methods=['POST'])
+@token_required
+def create_issues_batch(current_user_sub):
+    """
+    Creates several issues in one request.
+    Expects a JSON payload of the form {"issues": [{...}, ...]}.
+    """
+    # Decode and validate every issue (and the 1..MAX_BATCH_ISSUES bound) in one pass
+    try:
+        batch_data = new_issue_batch_decoder.decode(request.get_data())
+    except msgspec.DecodeError as e:
+        return jsonify(error=f"Invalid issues: {e}"), 400
+    issues_data = [msgspec.structs.asdict(issue_data) for issue_data in batch_data.issues]
+
+    # Check access once per distinct project
+    for project_id in {issue_data['projectId'] for issue_data in issues_data}:
+        if not user_has_project_access(current_user_sub, project_id):
+            return jsonify(error="Access denied to this project"), 403
+
+    issues = [build_issue_item(issue_data, current_user_sub) for issue_data in issues_data]
+
+    try:
+        # batch_writer sends 25-item BatchWriteItem calls and retries unprocessed items
+        with issues_table.batch_writer(overwrite_by_pkeys=['projectId', 'sortKey']) as batch:
+            for issue in issues:
+                batch.put_item(Item=issue)
+        for project_id in {issue['projectId'] for issue in issues}:
+            invalidate_issue_stats(project_id)
+        print(f"Created {len(issues)} issues in batch")
+        return json_response(issues, 201)
+    except ClientError as e:
+        print(f"DynamoDB error creating issues: {e}")
+        return jsonify(error="Database error occurred"), 500
+    except Exception as e:
+        print(f"Error creating issues: {e}")
+        return jsonify(error="Failed to create issues"), 500
+
 @app.route('/api/issues/<issue_id>', methods=['PUT'])
 @token_required
 def update_issue(current_user_sub, issue_id):
     try:
-        data = request.get_json()
+        try:
+            data = set_fields(issue_update_decoder.decode(request.get_data()))
+        except msgspec.DecodeError as e:
+            return jsonify(error=f"Invalid update: {e}"), 400
         if not data:
             return jsonify(error="No data provided"), 400
         
         print(f"Updating issue: {issue_id}")
         
-        # FIXED: Find the issue by scanning for the issue ID
-        response = issues_table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('id').eq(issue_id)
-        )
-        items = response.get('Items', [])
+        # Use the key sent by the client if any, else find it through the id index
+        current_issue = resolve_issue_key(issue_id, data)
 
-        if not items:
+        if not current_issue:
             print(f"Issue not found: {issue_id}")
             return jsonify(error="Issue not found"), 404
 
-        current_issue = items[0]
         print(f"Found issue: {current_issue}")
         
         # Check if user has access to the project
@@ -642,43 +1342,43 @@ def update_issue(current_user_sub, issue_id):
 
         # Prepare update expression
         update_expression_parts = ["updatedAt = :updated_at"]
-        expression_attribute_values = {':updated_at': datetime.now(timezone.utc).isoformat()}
-        expression_attribute_names = {}
+        expression_attribute_values = {':updated_at': utc_now_iso(), ':issue_id': issue_id}
+        expression_attribute_names = {'#issue_id': 'id'}
 
         # Handle allowed fields
-        allowed_fields = ['title', 'description', 'status', 'priority']
-        for field in allowed_fields:
+        # Values were already validated while decoding
+        for field in ISSUE_UPDATE_FIELDS:
             if field in data:
-                # Validate field values
-                if field in ['title', 'description'] and not data[field].strip():
-                    return jsonify(error=f"{field} cannot be empty"), 400
-                if field == 'status' and data[field] not in ['open', 'in-progress', 'resolved']:
-                    return jsonify(error="Status must be 'open', 'in-progress', or 'resolved'"), 400
-                if field == 'priority' and data[field] not in ['low', 'medium', 'high']:
-                    return jsonify(error="Priority must be 'low', 'medium', or 'high'"), 400
-                
                 update_expression_parts.append(f"#{field} = :{field}")
                 expression_attribute_names[f"#{field}"] = field
-                expression_attribute_values[f":{field}"] = data[field].strip() if isinstance(data[field], str) else data[field]
+                expression_attribute_values[f":{field}"] = data[field].strip()
 
         update_expression = "SET " + ", ".join(update_expression_parts)
         
         # FIXED: Update using projectId and sortKey as composite key
         update_args = {
-            'Key': {'projectId': current_issue['projectId'], 'sortKey': current_issue['sortKey']},
+            'TableName': DYNAMODB_ISSUES_TABLE,
+            'Key': serialize_item({'projectId': current_issue['projectId'], 'sortKey': current_issue['sortKey']}),
             'UpdateExpression': update_expression,
-            'ExpressionAttributeValues': expression_attribute_values,
+            'ExpressionAttributeValues': serialize_item(expression_attribute_values),
+            'ExpressionAttributeNames': expression_attribute_names,
+            # Never upsert: the key must belong to an existing item with this id
+            'ConditionExpression': '#issue_id = :issue_id',
             'ReturnValues': 'ALL_NEW'
         }
-        if expression_attribute_names:
-            update_args['ExpressionAttributeNames'] = expression_attribute_names
 
         # Update the issue
-        updated_response = issues_table.update_item(**update_args)
-        updated_issue = updated_response.get('Attributes')
+        try:
+            updated_response = dynamodb_client.update_item(**update_args)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return jsonify(error="Issue not found"), 404
+            raise
+        updated_issue = deserialize_item(updated_response.get('Attributes', {}))
+        invalidate_issue_stats(current_issue['projectId'])
         
         print(f"Updated issue: {updated_issue}")
-        return jsonify(serialize_issue(updated_issue)), 200
+        return json_response(updated_issue, 200)
         
     except ClientError as e:
         print(f"DynamoDB error updating issue: {e}")
@@ -691,25 +1391,27 @@ def update_issue(current_user_sub, issue_id):
 @token_required
 def delete_issue(current_user_sub, issue_id):
     try:
-        # Find the issue by scanning for the issue ID
-        response = issues_table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('id').eq(issue_id)
-        )
-        items = response.get('Items', [])
+        # Use the key passed as query parameters if any, else find it through the id index
+        current_issue = resolve_issue_key(issue_id, request.args)
         
-        if not items:
+        if not current_issue:
             return jsonify(error="Issue not found"), 404
         
-        current_issue = items[0]
-        
         # Check if user has access to the project
         if not user_has_project_access(current_user_sub, current_issue['projectId']):
             return jsonify(error="Access denied to this issue"), 403
 
         # FIXED: Delete using projectId and sortKey as composite key
-        issues_table.delete_item(
-            Key={'projectId': current_issue['projectId'], 'sortKey': current_issue['sortKey']}
-        )
+        try:
+            issues_table.delete_item(
+                Key={'projectId': current_issue['projectId'], 'sortKey': current_issue['sortKey']},
+                ConditionExpression=ISSUE_ID_ATTR.eq(issue_id)
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return jsonify(error="Issue not found"), 404
+            raise
+        invalidate_issue_stats(current_issue['projectId'])
         
         return jsonify(message="Issue deleted successfully"), 200
         
@@ -731,43 +1433,37 @@ def get_all_issues(current_user_sub):
         project_id_filter = request.args.get('projectId')
         
         accessible_issues = []
+        # Let DynamoDB drop non-matching rows before they cross the wire
+        filter_expression = build_issue_filter(status_filter, priority_filter, object_id_filter)
         
         # If filtering by specific project, use query (THIS IS NOW CORRECT)
         if project_id_filter:
             if user_has_project_access(current_user_sub, project_id_filter):
-                response = issues_table.query(
-                    KeyConditionExpression=boto3.dynamodb.conditions.Key('projectId').eq(project_id_filter),
-                    ScanIndexForward=False  # Most recent first
-                )
-                accessible_issues = response.get('Items', [])
+                # Already newest first from the createdAt index, so stream pages as they arrive.
+                # The first page is read here so early database errors still get a 500.
+                pages = query_project_issue_pages(project_id_filter, filter_expression)
+                first_page = next(pages, [])
+                return stream_json_pages(itertools.chain([first_page], pages))
         else:
             # Get all projects the user has access to
-            permissions_response = permissions_table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr('userId').eq(current_user_sub)
-            )
-            user_project_ids = [perm['projectId'] for perm in permissions_response.get('Items', [])]
+            user_project_ids = query_user_project_ids(current_user_sub)
             
-            # Query issues for each accessible project
-            for project_id in user_project_ids:
-                response = issues_table.query(
-                    KeyConditionExpression=boto3.dynamodb.conditions.Key('projectId').eq(project_id),
-                    ScanIndexForward=False
-                )
-                accessible_issues.extend(response.get('Items', []))
-        
-        # Apply additional filters
-        if status_filter:
-            accessible_issues = [issue for issue in accessible_issues if issue.get('status') == status_filter]
-        if priority_filter:
-            accessible_issues = [issue for issue in accessible_issues if issue.get('priority') == priority_filter]
-        if object_id_filter:
-            accessible_issues = [issue for issue in accessible_issues if issue.get('objectId') == object_id_filter]
-        
-        # Sort by creation date (most recent first)
-        accessible_issues.sort(key=lambda x: x.get('createdAt', ''), reverse=True)
-        
-        serialized_issues = [serialize_issue(issue) for issue in accessible_issues]
-        return jsonify(serialized_issues), 200
+            # Query issues for each accessible project concurrently
+            if user_project_ids:
+                with ThreadPoolExecutor(max_workers=min(ISSUE_QUERY_MAX_WORKERS, len(user_project_ids))) as executor:
+                    per_project_issues = list(executor.map(
+                        lambda project_id: query_project_issues(project_id, filter_expression),
+                        user_project_ids
+                    ))
+
+                # Each list is already newest first from the createdAt index, so a single
+                # k-way merge (most recent first) replaces concatenating and re-sorting
+                accessible_issues = list(heapq.merge(
+                    *per_project_issues, key=lambda x: x.get('createdAt', ''), reverse=True
+                ))
+        
+        # Decimals are converted by the encoder; no intermediate copy of the list
+        return json_response(accessible_issues, 200)
         
     except ClientError as e:
         print(f"DynamoDB error fetching all issues: {e}")
@@ -776,6 +1472,106 @@ def get_all_issues(current_user_sub):
         print(f"Error fetching all issues: {e}")
         return jsonify(error="Failed to fetch issues"), 500
     
+def compute_issue_stats(project_id):
+    """Count a project's issues by status and priority from scratch"""
+    # One COUNT query per bucket; DynamoDB returns only the counts, never the items
+    buckets = [('status', value) for value in sorted(ISSUE_STATUSES)] + \
+              [('priority', value) for value in sorted(ISSUE_PRIORITIES)]
+    with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+        counts = list(executor.map(
+            lambda bucket: count_project_issues(
+                project_id, ISSUE_FILTER_ATTRS[bucket[0]].eq(bucket[1])
+            ),
+            buckets
+        ))
+
+    stats = {'projectId': project_id, 'byStatus': {}, 'byPriority': {}}
+    for (attr_name, value), count in zip(buckets, counts):
+        stats['byStatus' if attr_name == 'status' else 'byPriority'][value] = count
+    stats['total'] = sum(stats['byStatus'].values())
+    return stats
+
+def load_issue_stats(project_id):
+    """A project's issue stats, from its STATS counter item when the stream keeps one"""
+    if ISSUE_STATS_FROM_STREAM:
+        stats_item = issues_table.get_item(
+            Key={'projectId': project_id, 'sortKey': STATS_SORT_KEY}
+        ).get('Item')
+        previous_seeded_at = stats_item.get('seededAt') if stats_item else None
+        if stats_item and previous_seeded_at is not None and \
+                time.time() - int(previous_seeded_at) < ISSUE_STATS_RESEED_AFTER:
+            stats = {field: stats_item.get(field) for field in ('byStatus', 'byPriority', 'total')}
+            stats['projectId'] = project_id
+            return stats
+
+    stats = compute_issue_stats(project_id)
+    if ISSUE_STATS_FROM_STREAM:
+        # Taken after the counts, so every write they included has a stream time at or before it
+        seed_issue_stats(stats, int(time.time()), previous_seeded_at)
+    return stats
+
+def invalidate_issue_stats(project_id):
+    """Drop this process's cached stats for a project after one of its issues changed"""
+    with issue_stats_cache_lock:
+        issue_stats_cache.pop(project_id, None)
+
+def seed_issue_stats(stats, seeded_at, previous_seeded_at=None):
+    """
+    Store freshly computed counts as the project's STATS item. The stats Lambda then applies
+    every issue write whose stream record is newer than seededAt (epoch seconds); older
+    records are already part of the counts. It leaves projects without the item alone.
+    Re-seeding replaces the item only if no other process re-seeded it since it was read.
+    """
+    if previous_seeded_at is None:
+        # No item yet, or one left from before seededAt existed
+        condition = {'ConditionExpression': 'attribute_not_exists(sortKey) OR attribute_not_exists(seededAt)'}
+    else:
+        condition = {
+            'ConditionExpression': 'seededAt = :previous',
+            'ExpressionAttributeValues': {':previous': previous_seeded_at}
+        }
+    try:
+        issues_table.put_item(
+            Item={**stats, 'sortKey': STATS_SORT_KEY, 'seededAt': seeded_at},
+            **condition
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            print(f"Warning: Could not seed issue stats for {stats['projectId']}: {e}")
+
+@app.route('/api/issues/stats', methods=['GET'])
+@token_required
+def get_issue_stats(current_user_sub):
+    """
+    Returns issue counts by status and priority for a project.
+    Expects a 'projectId' query parameter.
+    """
+    project_id = request.args.get('projectId')
+    if not project_id:
+        return jsonify(error="The 'projectId' query parameter is required"), 400
+
+    try:
+        if not user_has_project_access(current_user_sub, project_id):
+            return jsonify(error="Access denied to this project"), 403
+
+        with issue_stats_cache_lock:
+            body = issue_stats_cache.get(project_id)
+        if body is None:
+            body = orjson.dumps(load_issue_stats(project_id), default=json_serial)
+            with issue_stats_cache_lock:
+                issue_stats_cache[project_id] = body
+
+        response = app.response_class(body, status=200, mimetype='application/json')
+        response.headers['Cache-Control'] = f'private, max-age={ISSUE_STATS_CACHE_TTL}'
+        return response
+
+    except ClientError as e:
+        print(f"DynamoDB error fetching issue stats: {e}")
+        return jsonify(error="Database error occurred"), 500
+    except Exception as e:
+        print(f"Error fetching issue stats: {e}")
+        return jsonify(error="Failed to fetch issue stats"), 500
+
 @app.route('/api/profile', methods=['PUT'])
 @token_required
 def update_user_profile(current_user_sub):
@@ -813,10 +1609,7 @@ def debug_permissions(current_user_sub, project_id):
     """Debug endpoint to check project permissions"""
     try:
         # Check permissions for the current user
-        permissions_response = permissions_table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('projectId').eq(project_id)
-        )
-        permissions = permissions_response.get('Items', [])
+        permissions = query_project_permissions(project_id)
         
         user_permission = None
         for perm in permissions:
@@ -824,13 +1617,13 @@ def debug_permissions(current_user_sub, project_id):
                 user_permission = perm
                 break
         
-        return jsonify({
+        return json_response({
             'projectId': project_id,
             'currentUserSub': current_user_sub,
             'userHasAccess': user_permission is not None,
             'userPermission': user_permission,
             'allPermissions': permissions
-        }), 200
+        }, 200)
         
     except Exception as e:
         print(f"Error in debug permissions: {e}")
@@ -840,16 +1633,33 @@ def debug_permissions(current_user_sub, project_id):
 @app.route('/api/debug/issues', methods=['GET'])
 @token_required
 def debug_all_issues(current_user_sub):
-    """Debug endpoint to see all issues in the system"""
+    """Debug endpoint to page through all issues in the system (?limit=&cursor=)"""
     try:
-        response = issues_table.scan()
+        raw_limit = request.args.get('limit')
+        try:
+            limit = int(raw_limit) if raw_limit is not None else DEBUG_ISSUES_PAGE_SIZE
+        except ValueError:
+            return jsonify(error="limit must be a positive integer"), 400
+        if limit < 1:
+            return jsonify(error="limit must be a positive integer"), 400
+        scan_args = {'Limit': min(limit, DEBUG_ISSUES_MAX_PAGE_SIZE)}
+
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                scan_args['ExclusiveStartKey'] = decode_cursor(cursor)
+            except ValueError as e:
+                return jsonify(error=str(e)), 400
+
+        response = issues_table.scan(**scan_args)
         issues = response.get('Items', [])
         
-        return jsonify({
+        return json_response({
             'totalIssues': len(issues),
             'currentUserSub': current_user_sub,
-            'issues': [serialize_issue(issue) for issue in issues]
-        }), 200
+            'issues': issues,
+            'nextCursor': encode_cursor(response.get('LastEvaluatedKey'))
+        }, 200)
         
     except Exception as e:
         print(f"Error in debug issues: {e}")
@@ -879,8 +1689,6 @@ def trigger_compression(current_user_sub, project_id):
         
         # Trigger Lambda function for compression
         try:
-            lambda_client = session.client('lambda')
-            
             # Prepare the event payload
             event_payload = {
                 "Records": [
@@ -944,10 +1752,9 @@ def get_compression_status(current_user_sub, project_id):
             return jsonify(error="Project has no associated model"), 400
         
         # Check if compressed version exists
-        compressed_key = project['modelKey'].replace('uploads/', 'compressed/')
+        compressed_key = compressed_key_for(project['modelKey'])
         
-        try:
-            s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=compressed_key)
+        if object_exists(S3_BUCKET_NAME, compressed_key, strict=True):
             compressed_url = generate_presigned_url(S3_BUCKET_NAME, compressed_key)
             
             return jsonify({
@@ -957,17 +1764,13 @@ def get_compression_status(current_user_sub, project_id):
                 "originalKey": project['modelKey'],
                 "compressedKey": compressed_key
             }), 200
-            
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return jsonify({
-                    "projectId": project_id,
-                    "hasCompressedVersion": False,
-                    "originalKey": project['modelKey'],
-                    "compressedKey": compressed_key
-                }), 200
-            else:
-                raise e
+        
+        return jsonify({
+            "projectId": project_id,
+            "hasCompressedVersion": False,
+            "originalKey": project['modelKey'],
+            "compressedKey": compressed_key
+        }), 200
                 
     except Exception as e:
         print(f"Error checking compression status: {e}")
@@ -978,6 +1781,10 @@ def get_compression_status(current_user_sub, project_id):
 def not_found(error):
     return jsonify(error="Endpoint not found"), 404
 
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify(error="Request body is too large"), 413
+
 @app.errorhandler(500)
 def internal_error(error):
     return jsonify(error="Internal server error"), 500
@@ -988,4 +1795,5 @@ if __name__ == "__main__":
     print(f"AWS Region: {os.environ.get('AWS_REGION', 'Not Set')}")
     print(f"DynamoDB Table: {os.environ.get('DYNAMODB_TABLE_NAME', 'Not Set')}")
     print(f"S3_BUCKET_NAME: {S3_BUCKET_NAME}") 
-    app.run(host="0.0.0.0", port=4000, debug=True)
\ No newline at end of file
+    # Local development only; production runs under gunicorn via wsgi.py
+    app.run(host="0.0.0.0", port=4000, debug=os.environ.get('FLASK_DEBUG') == '1')
\ No newline at end of file
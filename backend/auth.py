@@ -1,8 +1,12 @@
 import os
+import re
+import time
+import threading
 import requests
 from functools import wraps
+from cachetools import TLRUCache
 from flask import request, jsonify
-from jose import jwt, jwk
+import jwt
 
 # It's best practice to get these from environment variables
 # Ensure you set these in your environment before running the app
@@ -10,18 +14,83 @@ COGNITO_REGION = os.environ.get('COGNITO_REGION', 'us-east-1')
 COGNITO_USERPOOL_ID = os.environ.get('COGNITO_USERPOOL_ID', 'us-east-1_Qz0XQbRYF')
 COGNITO_APP_CLIENT_ID = os.environ.get('COGNITO_APP_CLIENT_ID', '6trsdho1dueumlof1pqb8hqe67')
 
-# Construct the URL to fetch the public keys (JWKS)
-keys_url = f'https://cognito-idp.{COGNITO_REGION}.amazonaws.com/{COGNITO_USERPOOL_ID}/.well-known/jwks.json'
+# The user pool's issuer ('iss' claim) and the URL to fetch its public keys (JWKS)
+ISSUER = f'https://cognito-idp.{COGNITO_REGION}.amazonaws.com/{COGNITO_USERPOOL_ID}'
+keys_url = f'{ISSUER}/.well-known/jwks.json'
 
-# Fetch the keys and cache them. 
-# In a production app, you might implement a more robust caching mechanism.
-try:
-    response = requests.get(keys_url)
-    response.raise_for_status()
-    keys = response.json()['keys']
-except requests.exceptions.RequestException as e:
-    print(f"FATAL: Failed to fetch JWKS from Cognito: {e}")
-    keys = []
+# One keep-alive session for every call to the JWKS endpoint
+http_session = requests.Session()
+
+# Public keys by kid, parsed once into cryptography key objects for jwt.decode
+MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+JWKS_DEFAULT_MAX_AGE = int(os.environ.get('JWKS_DEFAULT_MAX_AGE', '3600'))
+JWKS_MIN_REFRESH_INTERVAL = int(os.environ.get('JWKS_MIN_REFRESH_INTERVAL', '60'))
+
+class JwksCache:
+    """Lazily fetched JWKS that revalidates with ETag/Last-Modified and refetches on an unknown kid."""
+
+    def __init__(self, url):
+        self.url = url
+        self.keys = {}
+        self.etag = None
+        self.last_modified = None
+        self.expires_at = 0
+        self.last_fetch = 0
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        self.last_fetch = time.time()
+        try:
+            response = http_session.get(self.url, headers=headers, timeout=5)
+            if response.status_code != 304:
+                response.raise_for_status()
+                self.keys = {
+                    key['kid']: jwt.PyJWK(key, algorithm='RS256').key
+                    for key in response.json()['keys']
+                }
+                self.etag = response.headers.get('ETag')
+                self.last_modified = response.headers.get('Last-Modified')
+        except (requests.exceptions.RequestException, jwt.PyJWKError, ValueError, KeyError) as e:
+            # Keep serving the keys we already have; the next attempt is rate limited below
+            print(f"Failed to fetch JWKS from Cognito: {e}")
+            return
+
+        max_age = MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+        self.expires_at = self.last_fetch + (int(max_age.group(1)) if max_age else JWKS_DEFAULT_MAX_AGE)
+
+    def get_key(self, kid):
+        """Return the public key for kid, refreshing when stale or when kid is unknown (key rotation)."""
+        if kid not in self.keys or time.time() >= self.expires_at:
+            with self.lock:
+                now = time.time()
+                stale = kid not in self.keys or now >= self.expires_at
+                if stale and now - self.last_fetch >= JWKS_MIN_REFRESH_INTERVAL:
+                    self.refresh()
+        return self.keys.get(kid)
+
+jwks_cache = JwksCache(keys_url)
+
+# Verified token payloads keyed by the raw token, so repeat calls skip the RSA verify.
+# Each entry lives until the token's own 'exp' (capped at TOKEN_CACHE_TTL), so an
+# expired token is never served from the cache.
+TOKEN_CACHE_TTL = int(os.environ.get('TOKEN_CACHE_TTL', '3600'))
+
+def token_expiry(token, payload, now):
+    return min(payload['exp'], now + TOKEN_CACHE_TTL)
+
+token_cache = TLRUCache(maxsize=10_000, ttu=token_expiry, timer=time.time)
+token_cache_lock = threading.Lock()
+
+def get_cached_payload(token):
+    """Return the cached payload for a token that has already been verified and has not expired."""
+    with token_cache_lock:
+        return token_cache.get(token)
 
 def token_required(f):
     """A decorator to validate the Cognito JWT token present in the Authorization header."""
@@ -36,26 +105,20 @@ def token_required(f):
         if not token:
             return jsonify({'message': 'Authorization token is missing!'}), 401
 
-        if not keys:
-            return jsonify({'message': 'JWKS not loaded, cannot validate token. Check Cognito configuration.'}), 500
+        payload = get_cached_payload(token)
+        if payload:
+            kwargs['current_user_sub'] = payload['sub']
+            return f(*args, **kwargs)
 
         try:
             # Get the unverified header from the token to find the correct public key
             unverified_header = jwt.get_unverified_header(token)
             
             # Find the appropriate public key from the JWKS
-            rsa_key = {}
-            for key in keys:
-                if key['kid'] == unverified_header['kid']:
-                    rsa_key = {
-                        'kty': key['kty'],
-                        'kid': key['kid'],
-                        'use': key['use'],
-                        'n': key['n'],
-                        'e': key['e']
-                    }
-                    break
+            rsa_key = jwks_cache.get_key(unverified_header['kid'])
             
+            if not rsa_key and not jwks_cache.keys:
+                return jsonify({'message': 'JWKS not loaded, cannot validate token. Check Cognito configuration.'}), 500
             if not rsa_key:
                 return jsonify({'message': 'Public key not found in JWKS'}), 500
 
@@ -65,16 +128,21 @@ def token_required(f):
                 rsa_key,
                 algorithms=['RS256'],
                 audience=COGNITO_APP_CLIENT_ID,  # The 'aud' claim
-                issuer=f"https://cognito-idp.{COGNITO_REGION}.amazonaws.com/{COGNITO_USERPOOL_ID}" # The 'iss' claim
+                issuer=ISSUER  # The 'iss' claim
             )
+
+            with token_cache_lock:
+                token_cache[token] = payload
             
             # Pass the user's unique identifier ('sub' claim) to the decorated function
             kwargs['current_user_sub'] = payload['sub']
 
         except jwt.ExpiredSignatureError:
             return jsonify({'message': 'Token has expired!'}), 401
-        except jwt.JWTClaimsError as e:
+        except (jwt.InvalidAudienceError, jwt.InvalidIssuerError) as e:
             return jsonify({'message': 'Invalid claims, please check the audience and issuer', 'error': str(e)}), 401
+        except jwt.InvalidTokenError as e:
+            return jsonify({'message': 'Invalid token', 'error': str(e)}), 401
         except Exception as e:
             return jsonify({'message': 'Error decoding token', 'error': str(e)}), 500
 
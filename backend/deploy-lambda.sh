@@ -10,6 +10,8 @@ FUNCTION_NAME="bim-viewer-compression"
 S3_BUCKET_NAME="${S3_BUCKET_NAME:-your-bim-viewer-bucket}"
 REGION="${AWS_REGION:-us-east-1}"
 STACK_NAME="bim-viewer-compression-stack"
+STATS_FUNCTION_NAME="bim-viewer-issue-stats"
+ISSUES_TABLE_NAME="${DYNAMODB_TABLE_NAME:-bim-viewer-issues}"
 
 echo "🚀 Starting Lambda deployment..."
 
@@ -27,6 +29,17 @@ fi
 
 echo "✅ AWS credentials verified"
 
+# The stats Lambda consumes the issues table stream (enabled by setup_dynamodb.py)
+ISSUES_STREAM_ARN=$(aws dynamodb describe-table \
+    --table-name $ISSUES_TABLE_NAME \
+    --query 'Table.LatestStreamArn' \
+    --output text \
+    --region $REGION 2>/dev/null || true)
+if [ -z "$ISSUES_STREAM_ARN" ] || [ "$ISSUES_STREAM_ARN" = "None" ]; then
+    echo "⚠️  No stream on $ISSUES_TABLE_NAME; skipping the issue stats Lambda (run setup_dynamodb.py first)"
+    ISSUES_STREAM_ARN=""
+fi
+
 # Create deployment directory
 DEPLOY_DIR="lambda-deployment"
 rm -rf $DEPLOY_DIR
@@ -34,8 +47,9 @@ mkdir -p $DEPLOY_DIR
 
 echo "📦 Creating deployment package..."
 
-# Copy Lambda function
+# Copy Lambda functions
 cp compress-glb.js $DEPLOY_DIR/
+cp issue-stats-stream.js $DEPLOY_DIR/
 
 # Copy package.json
 cp lambda-package.json $DEPLOY_DIR/package.json
@@ -61,6 +75,8 @@ if aws cloudformation describe-stacks --stack-name $STACK_NAME --region $REGION
         --stack-name $STACK_NAME \
         --template-body file://lambda-template.yaml \
         --parameters ParameterKey=S3BucketName,ParameterValue=$S3_BUCKET_NAME \
+                     ParameterKey=IssuesTableName,ParameterValue=$ISSUES_TABLE_NAME \
+                     ParameterKey=IssuesStreamArn,ParameterValue=$ISSUES_STREAM_ARN \
         --capabilities CAPABILITY_NAMED_IAM \
         --region $REGION
     
@@ -74,6 +90,8 @@ else
         --stack-name $STACK_NAME \
         --template-body file://lambda-template.yaml \
         --parameters ParameterKey=S3BucketName,ParameterValue=$S3_BUCKET_NAME \
+                     ParameterKey=IssuesTableName,ParameterValue=$ISSUES_TABLE_NAME \
+                     ParameterKey=IssuesStreamArn,ParameterValue=$ISSUES_STREAM_ARN \
         --capabilities CAPABILITY_NAMED_IAM \
         --region $REGION
     
@@ -96,6 +114,18 @@ aws lambda wait function-updated \
     --function-name $FUNCTION_NAME \
     --region $REGION
 
+if [ -n "$ISSUES_STREAM_ARN" ]; then
+    echo "🔄 Updating issue stats Lambda code..."
+    aws lambda update-function-code \
+        --function-name $STATS_FUNCTION_NAME \
+        --zip-file fileb://lambda-package.zip \
+        --region $REGION
+
+    aws lambda wait function-updated \
+        --function-name $STATS_FUNCTION_NAME \
+        --region $REGION
+fi
+
 # Clean up
 echo "🧹 Cleaning up deployment files..."
 rm -rf $DEPLOY_DIR
@@ -112,4 +142,7 @@ echo ""
 echo "🔗 View your Lambda function in the AWS Console:"
 echo "   https://console.aws.amazon.com/lambda/home?region=$REGION#/functions/$FUNCTION_NAME"
 echo ""
-echo "📝 To test the function, upload a GLB file to s3://$S3_BUCKET_NAME/uploads/" 
\ No newline at end of file
+echo "📝 To test the function, upload a GLB file to s3://$S3_BUCKET_NAME/uploads/"
+if [ -n "$ISSUES_STREAM_ARN" ]; then
+    echo "📊 Set ISSUE_STATS_FROM_STREAM=1 on the backend to serve /api/issues/stats from the STATS counters"
+fi 
\ No newline at end of file
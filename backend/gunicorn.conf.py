@@ -0,0 +1,18 @@
+# Gunicorn settings for the backend: gunicorn -c gunicorn.conf.py wsgi:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '4000')}"
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+# Handlers spend nearly all their time waiting on AWS, so cooperative gevent workers
+# (which monkey-patch sockets before loading the app) carry far more requests in flight.
+# Set GUNICORN_WORKER_CLASS=gthread to fall back to OS threads.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+# Each worker builds its own boto3 clients; see reinit_after_fork in app.py before enabling
+preload_app = False
+# Longer than typical load balancer idle timeouts so proxied connections get reused
+keepalive = 65
+# Legacy form uploads are received and sent on to S3 within the request, so allow slow ones
+timeout = 120
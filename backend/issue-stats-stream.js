@@ -0,0 +1,96 @@
+const AWS = require('aws-sdk');
+
+// DynamoDB Stream consumer for the issues table.
+// Keeps one per-project counter item (sortKey 'STATS') in step with issue writes,
+// so /api/issues/stats is a single GetItem instead of a set of COUNT queries.
+
+const dynamodb = new AWS.DynamoDB.DocumentClient();
+const TABLE_NAME = process.env.ISSUES_TABLE_NAME || 'bim-viewer-issues';
+const STATS_SORT_KEY = 'STATS';
+
+// Add +1/-1 for every counter an issue image touches
+function addImage(deltas, image, sign) {
+  if (!image) return;
+  deltas.total = (deltas.total || 0) + sign;
+  for (const [group, attr] of [['byStatus', 'status'], ['byPriority', 'priority']]) {
+    if (!image[attr]) continue;
+    const key = `${group}.${image[attr]}`;
+    deltas[key] = (deltas[key] || 0) + sign;
+  }
+}
+
+async function applyDeltas(projectId, eventTime, deltas) {
+  const names = { '#seededAt': 'seededAt' };
+  const values = { ':eventTime': eventTime };
+  const clauses = [];
+  Object.entries(deltas).forEach(([path, delta], i) => {
+    const [group, bucket] = path.split('.');
+    names[`#g${i}`] = group;
+    values[`:d${i}`] = delta;
+    if (bucket === undefined) {
+      clauses.push(`#g${i} :d${i}`);
+    } else {
+      names[`#b${i}`] = bucket;
+      clauses.push(`#g${i}.#b${i} :d${i}`);
+    }
+  });
+
+  try {
+    await dynamodb.update({
+      TableName: TABLE_NAME,
+      Key: { projectId, sortKey: STATS_SORT_KEY },
+      UpdateExpression: `ADD ${clauses.join(', ')}`,
+      // The API seeds the item with full counts on first read; until then there is nothing to adjust.
+      // Writes at or before seededAt were already in those counts, so they must not be added again
+      // (items seeded before seededAt existed have no such cutoff).
+      ConditionExpression: 'attribute_exists(projectId) AND (attribute_not_exists(#seededAt) OR #seededAt < :eventTime)',
+      ExpressionAttributeNames: names,
+      ExpressionAttributeValues: values
+    }).promise();
+  } catch (error) {
+    if (error.code !== 'ConditionalCheckFailedException') throw error;
+  }
+}
+
+exports.handler = async (event) => {
+  // Sum the deltas of consecutive records for the same project and stream second
+  // (ApproximateCreationDateTime, epoch seconds), so a burst of writes becomes one update and
+  // each update can be checked against the item's seededAt. Runs keep stream order so a
+  // failure can be reported at the exact record where processing stopped.
+  const runs = [];
+
+  for (const record of event.Records) {
+    const keys = AWS.DynamoDB.Converter.unmarshall(record.dynamodb.Keys);
+    if (!keys.sortKey || !keys.sortKey.startsWith('ISSUE#')) continue;
+
+    const oldImage = record.dynamodb.OldImage && AWS.DynamoDB.Converter.unmarshall(record.dynamodb.OldImage);
+    const newImage = record.dynamodb.NewImage && AWS.DynamoDB.Converter.unmarshall(record.dynamodb.NewImage);
+
+    const eventTime = Math.floor(record.dynamodb.ApproximateCreationDateTime);
+    let run = runs[runs.length - 1];
+    if (!run || run.projectId !== keys.projectId || run.eventTime !== eventTime) {
+      run = { projectId: keys.projectId, eventTime, firstSequenceNumber: record.dynamodb.SequenceNumber, deltas: {} };
+      runs.push(run);
+    }
+    addImage(run.deltas, oldImage, -1);
+    addImage(run.deltas, newImage, 1);
+  }
+
+  for (const { projectId, eventTime, firstSequenceNumber, deltas } of runs) {
+    for (const path of Object.keys(deltas)) {
+      if (deltas[path] === 0) delete deltas[path];
+    }
+    if (Object.keys(deltas).length === 0) continue;
+    console.log(`Updating issue stats for project ${projectId} at ${eventTime}:`, JSON.stringify(deltas));
+    try {
+      await applyDeltas(projectId, eventTime, deltas);
+    } catch (error) {
+      // ADD is not idempotent: stop here and have Lambda checkpoint everything before this run,
+      // so a retry resumes at it instead of re-adding the runs that already went through
+      console.error(`Failed to update issue stats for project ${projectId}:`, error);
+      return { batchItemFailures: [{ itemIdentifier: firstSequenceNumber }] };
+    }
+  }
+
+  return { batchItemFailures: [] };
+};
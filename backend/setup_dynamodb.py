@@ -1,5 +1,6 @@
 import boto3
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,6 +9,9 @@ load_dotenv()
 # Ensure AWS credentials and region are set in your environment or .env file
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 
+# Seconds between describe_table polls while a new index backfills
+INDEX_POLL_INTERVAL = 10
+
 # Initialize DynamoDB resource
 try:
     dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
@@ -15,40 +19,144 @@ except Exception as e:
     print(f"Error connecting to AWS. Please check your credentials and region setup. Details: {e}")
     exit()
 
-def create_table(table_name, key_schema, attribute_definitions, provisioned_throughput):
+def create_table(table_name, key_schema, attribute_definitions, provisioned_throughput,
+                 global_secondary_indexes=None, stream_view_type=None, ttl_attribute=None):
     """A generic function to create a DynamoDB table."""
     print(f"Attempting to create table: {table_name}...")
     try:
-        table = dynamodb.create_table(
-            TableName=table_name,
-            KeySchema=key_schema,
-            AttributeDefinitions=attribute_definitions,
-            ProvisionedThroughput=provisioned_throughput
-        )
+        create_args = {
+            'TableName': table_name,
+            'KeySchema': key_schema,
+            'AttributeDefinitions': attribute_definitions,
+            'ProvisionedThroughput': provisioned_throughput
+        }
+        if global_secondary_indexes:
+            create_args['GlobalSecondaryIndexes'] = global_secondary_indexes
+        if stream_view_type:
+            create_args['StreamSpecification'] = {'StreamEnabled': True, 'StreamViewType': stream_view_type}
+        table = dynamodb.create_table(**create_args)
         # Wait until the table exists.
         table.wait_until_exists()
         print(f"Table '{table_name}' created successfully.")
+        if ttl_attribute:
+            enable_ttl(table_name, ttl_attribute)
     except dynamodb.meta.client.exceptions.ResourceInUseException:
-        print(f"Table '{table_name}' already exists. No action taken.")
+        print(f"Table '{table_name}' already exists.")
+        if global_secondary_indexes:
+            add_missing_indexes(table_name, attribute_definitions, global_secondary_indexes)
+        if stream_view_type:
+            enable_stream(table_name, stream_view_type)
+        if ttl_attribute:
+            enable_ttl(table_name, ttl_attribute)
     except Exception as e:
         print(f"An unexpected error occurred creating table '{table_name}': {e}")
 
+def wait_for_active_indexes(table_name):
+    """Blocks until every GSI on the table has finished creating (the table_exists waiter doesn't)."""
+    while True:
+        table = dynamodb.meta.client.describe_table(TableName=table_name)['Table']
+        pending = [gsi['IndexName'] for gsi in table.get('GlobalSecondaryIndexes', [])
+                   if gsi['IndexStatus'] != 'ACTIVE']
+        if not pending:
+            return
+        print(f"Waiting for indexes {', '.join(pending)} on '{table_name}' to become active...")
+        time.sleep(INDEX_POLL_INTERVAL)
+
+def add_missing_indexes(table_name, attribute_definitions, global_secondary_indexes):
+    """Adds any GSIs that an already existing table is missing (one-time migration)."""
+    table = dynamodb.Table(table_name)
+    existing = {gsi['IndexName'] for gsi in (table.global_secondary_indexes or [])}
+    for gsi in global_secondary_indexes:
+        if gsi['IndexName'] in existing:
+            continue
+        print(f"Adding index '{gsi['IndexName']}' to table '{table_name}'...")
+        try:
+            # DynamoDB only allows one GSI creation per UpdateTable call, and rejects the next
+            # one while an earlier index is still backfilling
+            wait_for_active_indexes(table_name)
+            dynamodb.meta.client.update_table(
+                TableName=table_name,
+                AttributeDefinitions=attribute_definitions,
+                GlobalSecondaryIndexCreates=[{'Create': gsi}]
+            )
+            wait_for_active_indexes(table_name)
+            print(f"Index '{gsi['IndexName']}' is active on '{table_name}'.")
+        except Exception as e:
+            # Later tables and the app rely on these indexes, so don't carry on without one
+            print(f"Error: Could not add index '{gsi['IndexName']}' to '{table_name}': {e}")
+            exit(1)
+
+def enable_stream(table_name, stream_view_type):
+    """Turns on the table's stream if an already existing table has none (one-time migration)."""
+    table = dynamodb.Table(table_name)
+    if (table.stream_specification or {}).get('StreamEnabled'):
+        return
+    print(f"Enabling {stream_view_type} stream on table '{table_name}'...")
+    try:
+        dynamodb.meta.client.update_table(
+            TableName=table_name,
+            StreamSpecification={'StreamEnabled': True, 'StreamViewType': stream_view_type}
+        )
+        dynamodb.meta.client.get_waiter('table_exists').wait(TableName=table_name)
+        print(f"Stream enabled on '{table_name}'.")
+    except Exception as e:
+        print(f"Could not enable stream on '{table_name}': {e}")
+
+def enable_ttl(table_name, attribute_name):
+    """Lets DynamoDB expire items by an epoch-seconds attribute (TTL can't be set at creation)."""
+    client = dynamodb.meta.client
+    try:
+        status = client.describe_time_to_live(TableName=table_name)['TimeToLiveDescription']
+        if status.get('TimeToLiveStatus') in ('ENABLED', 'ENABLING'):
+            return
+        print(f"Enabling TTL on '{attribute_name}' for table '{table_name}'...")
+        client.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': attribute_name}
+        )
+        print(f"TTL enabled on '{table_name}'.")
+    except Exception as e:
+        print(f"Could not enable TTL on '{table_name}': {e}")
+
 def setup_all_tables():
     """Sets up all the required tables for the BIM Viewer application."""
     print("--- Starting Database Setup ---")
 
-    # 1. Issues Table (from your original file)
+    # 1. Issues Table (keyed by project, matching app.py)
     create_table(
         table_name='bim-viewer-issues',
         key_schema=[
-            {'AttributeName': 'objectId', 'KeyType': 'HASH'},  # Partition key
-            {'AttributeName': 'sortKey', 'KeyType': 'RANGE'}   # Sort key
+            {'AttributeName': 'projectId', 'KeyType': 'HASH'},  # Partition key
+            {'AttributeName': 'sortKey', 'KeyType': 'RANGE'}    # Sort key
         ],
         attribute_definitions=[
-            {'AttributeName': 'objectId', 'AttributeType': 'S'},
-            {'AttributeName': 'sortKey', 'AttributeType': 'S'}
+            {'AttributeName': 'projectId', 'AttributeType': 'S'},
+            {'AttributeName': 'sortKey', 'AttributeType': 'S'},
+            {'AttributeName': 'id', 'AttributeType': 'S'},
+            {'AttributeName': 'createdAt', 'AttributeType': 'S'}
         ],
-        provisioned_throughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+        provisioned_throughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5},
+        global_secondary_indexes=[
+            {
+                # Point lookup of an issue by its id (update/delete)
+                'IndexName': 'id-index',
+                'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}],
+                'Projection': {'ProjectionType': 'KEYS_ONLY'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            },
+            {
+                # A project's issues in creation order (sortKey is not time-ordered)
+                'IndexName': 'projectId-createdAt-index',
+                'KeySchema': [
+                    {'AttributeName': 'projectId', 'KeyType': 'HASH'},
+                    {'AttributeName': 'createdAt', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            }
+        ],
+        # Consumed by the issue stats Lambda (issue-stats-stream.js) to keep STATS counters current
+        stream_view_type='NEW_AND_OLD_IMAGES'
     )
 
     # 2. Projects Table (NEW)
@@ -60,7 +168,9 @@ def setup_all_tables():
         attribute_definitions=[
             {'AttributeName': 'projectId', 'AttributeType': 'S'}
         ],
-        provisioned_throughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+        provisioned_throughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5},
+        # Pending browser-direct uploads that are never confirmed expire on their own
+        ttl_attribute='expiresAt'
     )
 
     # 3. Project Permissions Table (NEW)
@@ -70,9 +180,30 @@ def setup_all_tables():
             {'AttributeName': 'permissionId', 'KeyType': 'HASH'}  # Partition key
         ],
         attribute_definitions=[
-            {'AttributeName': 'permissionId', 'AttributeType': 'S'}
+            {'AttributeName': 'permissionId', 'AttributeType': 'S'},
+            {'AttributeName': 'userId', 'AttributeType': 'S'},
+            {'AttributeName': 'projectId', 'AttributeType': 'S'}
         ],
-        provisioned_throughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+        provisioned_throughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5},
+        global_secondary_indexes=[
+            {
+                # A user's projects (PK only) and point access checks (PK + SK)
+                'IndexName': 'userId-projectId-index',
+                'KeySchema': [
+                    {'AttributeName': 'userId', 'KeyType': 'HASH'},
+                    {'AttributeName': 'projectId', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            },
+            {
+                # Everyone with access to a project (project deletion, debug listing)
+                'IndexName': 'projectId-index',
+                'KeySchema': [{'AttributeName': 'projectId', 'KeyType': 'HASH'}],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            }
+        ]
     )
 
     print("\n--- Database Setup Complete ---")
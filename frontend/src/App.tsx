@@ -491,9 +491,15 @@ const IssuesPanel = ({ objectData, authToken, projectId, user }: { objectData: a
     setLoading(true);
     setError(null);
     try {
+      // Sending the issue's key lets the backend skip looking it up by id
+      const currentIssue = issues.find(issue => issue.id === issueId);
       const response = await makeAuthenticatedRequest(`${API_URL}/api/issues/${issueId}`, {
         method: 'PUT',
-        body: JSON.stringify({ status }),
+        body: JSON.stringify({
+          status,
+          projectId: currentIssue?.projectId,
+          sortKey: currentIssue?.sortKey,
+        }),
       });
       
       if (!response.ok) {
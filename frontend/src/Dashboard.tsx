@@ -61,23 +61,40 @@ const CreateProjectModal = ({ authToken, onClose, onProjectCreated }: {
     setError(null);
     setUploadProgress(0);
 
-    const formData = new FormData();
-    formData.append('projectName', projectName.trim());
-    formData.append('model', file);
-
     try {
-      const response = await axios.post(
-        `${API_URL}/api/projects`,
-        formData,
-        {
-          headers: { 'Authorization': `Bearer ${authToken}` },
-          onUploadProgress: (progressEvent) => {
-            if (progressEvent.total) {
-              const percent = Math.round((progressEvent.loaded * 100) / progressEvent.total);
-              setUploadProgress(percent);
-            }
+      // 1. Reserve the project and get a presigned URL for the model
+      const initResponse = await fetch(`${API_URL}/api/projects/init`, {
+        method: 'POST',
+        headers: {
+          'Authorization': `Bearer ${authToken}`,
+          'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({ projectName: projectName.trim(), fileName: file.name })
+      });
+      const upload = await initResponse.json();
+      if (!initResponse.ok) throw new Error(upload.error || 'Failed to start upload');
+
+      // 2. Upload the model straight to S3 as a presigned POST form, bypassing the API server.
+      // S3 checks the policy fields; the file must be the last field in the form.
+      const uploadForm = new FormData();
+      Object.entries(upload.uploadFields as Record<string, string>).forEach(([name, value]) => {
+        uploadForm.append(name, value);
+      });
+      uploadForm.append('file', file);
+      await axios.post(upload.uploadUrl, uploadForm, {
+        onUploadProgress: (progressEvent) => {
+          if (progressEvent.total) {
+            const percent = Math.round((progressEvent.loaded * 100) / progressEvent.total);
+            setUploadProgress(percent);
           }
         }
+      });
+
+      // 3. Confirm so the project is created and shows up in the list
+      const response = await axios.post(
+        `${API_URL}/api/projects/${upload.projectId}/confirm`,
+        null,
+        { headers: { 'Authorization': `Bearer ${authToken}` } }
       );
       const result = response.data;
       onProjectCreated(result);